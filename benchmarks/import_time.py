@@ -0,0 +1,88 @@
+"""Check import time and heavy dependencies of the headless entry points.
+
+Each module is imported in a fresh interpreter with ``python -X importtime``.
+The script fails if a module takes longer than its budget (best of several
+runs) or pulls in a package that its code path does not need::
+
+    python benchmarks/import_time.py
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+UI_STACK = {"streamlit", "altair"}
+
+# module: (budget in ms, packages that must not be imported)
+BUDGETS = {
+    "src.report_charts": (50, UI_STACK | {"pandas", "mzqc"}),
+    "src.validator": (500, UI_STACK | {"pandas", "mzqc", "requests"}),
+    "src.parser": (800, UI_STACK | {"mzqc", "jsonschema", "requests"}),
+    "src.utils": (800, UI_STACK | {"mzqc", "jsonschema", "requests"}),
+    "src.exporter": (800, UI_STACK | {"mzqc", "openpyxl"}),
+    "src.service": (1200, UI_STACK | {"mzqc", "requests"}),
+}
+
+
+def measure(module):
+    """Return the cumulative import time in ms and the imported packages."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr}")
+    total_us = 0
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.split("|"))
+        if not cumulative.isdigit():
+            continue
+        packages.add(name.split(".")[0])
+        if name == module:
+            total_us = int(cumulative)
+    return total_us / 1000, packages
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--runs", type=int, default=3)
+    arg_parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply every budget, e.g. on slow CI machines",
+    )
+    args = arg_parser.parse_args(argv)
+
+    failures = []
+    for module, (budget_ms, forbidden) in BUDGETS.items():
+        timings = []
+        packages = set()
+        for _ in range(args.runs):
+            elapsed_ms, packages = measure(module)
+            timings.append(elapsed_ms)
+        best = min(timings)
+        limit = budget_ms * args.scale
+        leaked = sorted(packages & forbidden)
+        status = "ok" if best <= limit and not leaked else "FAIL"
+        print(f"{module:<20} {best:8.1f} ms  (budget {limit:.0f} ms)  {status}")
+        if best > limit:
+            failures.append(f"{module} took {best:.1f} ms > {limit:.0f} ms")
+        if leaked:
+            failures.append(f"{module} imports {', '.join(leaked)}")
+
+    for failure in failures:
+        print(f"  - {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
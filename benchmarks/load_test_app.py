@@ -0,0 +1,393 @@
+"""Simulate concurrent users of the Streamlit app and report rerun latency.
+
+Each session is driven headlessly with Streamlit's ``AppTest``: it uploads a
+synthetic mzQC file, switches between runs, enables comparison mode and
+steps through metrics. All sessions share one process, like users of one
+server, so shared caches are exercised as in production. The schema download
+and the semantic check are stubbed, so results do not depend on the network::
+
+    python benchmarks/load_test_app.py --sessions 8 --runs 20 --list-length 2000
+
+Use ``--max-p95-ms`` to fail (exit code 1) when reruns get slower than a
+threshold, e.g. in CI before a deployment. The run also fails when a session
+raises, shows an error or misses a widget it expects.
+"""
+
+import argparse
+import functools
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+UPLOAD_KEY = "_load_test_upload"
+VALIDATION_WAIT_SECONDS = 30
+
+
+FRAGMENTS = (
+    "render_run_view",
+    "render_comparison_view",
+    "render_metric_comparison",
+    "render_export_panel",
+)
+FRAGMENT_PREFIX = "fragment "
+
+
+def instrument_fragments(latencies, lock):
+    """Time the body of every fragment of the app.
+
+    AppTest always reruns the whole script, while in a live app a widget
+    inside a fragment only reruns that fragment's body. Timing the bodies
+    shows what those scoped reruns cost next to the full reruns.
+    """
+    import streamlit as st
+
+    from src import main
+
+    for name in FRAGMENTS:
+        body = getattr(main, name).__wrapped__
+
+        @functools.wraps(body)
+        def timed_body(*args, _body=body, _name=name, **kwargs):
+            start = time.perf_counter()
+            try:
+                return _body(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    latencies.setdefault(FRAGMENT_PREFIX + _name, []).append(elapsed)
+
+        setattr(main, name, st.fragment(timed_body))
+
+
+def stub_network_validation():
+    """Replace the schema download and the semantic (CV) check with no-ops."""
+    from src import validator
+
+    validator.load_schema_from_web = lambda: {}
+    validator.validate_semantics = lambda json_str: {}
+
+
+def make_synthetic_mzqc(runs, scalar_metrics, list_metrics, list_length, seed):
+    """Build an mzQC document with random metric values."""
+    rng = random.Random(seed)
+    run_qualities = []
+    for r in range(runs):
+        metrics = [
+            {
+                "accession": f"MS:40000{m:02d}",
+                "name": f"scalar metric {m}",
+                "value": rng.uniform(0, 1000),
+            }
+            for m in range(scalar_metrics)
+        ]
+        metrics += [
+            {
+                "accession": f"MS:40001{m:02d}",
+                "name": f"list metric {m}",
+                "value": [rng.gauss(r, 1) for _ in range(list_length)],
+            }
+            for m in range(list_metrics)
+        ]
+        run_qualities.append(
+            {
+                "metadata": {
+                    "label": f"synthetic_run_{r + 1}",
+                    "inputFiles": [
+                        {
+                            "location": f"file:///data/run_{r + 1}.mzML",
+                            "name": f"run_{r + 1}",
+                            "fileFormat": {"accession": "MS:1000584", "name": "mzML"},
+                        }
+                    ],
+                    "analysisSoftware": [
+                        {
+                            "accession": "MS:1000752",
+                            "name": "TOPP software",
+                            "version": "3.0",
+                            "uri": "https://www.openms.de",
+                        }
+                    ],
+                },
+                "qualityMetrics": metrics,
+            }
+        )
+    return json.dumps(
+        {
+            "mzQC": {
+                "version": "1.0.0",
+                "creationDate": "2025-01-01T00:00:00",
+                "contactName": "load test",
+                "description": f"synthetic file, seed {seed}",
+                "runQualities": run_qualities,
+                "controlledVocabularies": [
+                    {
+                        "name": "Proteomics Standards Initiative Mass Spectrometry "
+                        "Ontology",
+                        "uri": "https://github.com/HUPO-PSI/psi-ms-CV/releases/"
+                        "download/v4.1.130/psi-ms.obo",
+                        "version": "4.1.130",
+                    }
+                ],
+            }
+        }
+    )
+
+
+def session_script():
+    """App script run by every simulated session (executed by AppTest)."""
+    import io
+
+    import streamlit as st
+
+    from src import main
+
+    class SyntheticUpload(io.BytesIO):
+        name = "synthetic.mzQC"
+
+    def file_uploader(*args, **kwargs):
+        # Read from session state at call time so that concurrent sessions,
+        # which share this patched function, each get their own file.
+        payload = st.session_state.get("_load_test_upload")
+        return SyntheticUpload(payload) if payload else None
+
+    st.file_uploader = file_uploader
+    main.main()
+
+
+def _find(elements, label):
+    for element in elements:
+        if element.label == label:
+            return element
+    return None
+
+
+def run_session(payload, steps, timeout, latencies, lock, counters):
+    """Drive one session through a fixed sequence of interactions."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_function(session_script, default_timeout=timeout)
+    at.session_state[UPLOAD_KEY] = payload
+    errors = []
+
+    def timed(kind, action):
+        start = time.perf_counter()
+        action()
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.setdefault(kind, []).append(elapsed)
+        if not at.exception and not len(at.main):
+            # AppTest is not thread-safe and now and then returns an empty
+            # page under concurrent sessions; rerun once and count it.
+            with lock:
+                counters["empty_page_retries"] += 1
+            at.run()
+        if at.exception:
+            errors.append(f"{kind}: {at.exception[0].value}")
+        for error in at.error:
+            errors.append(f"{kind}: page shows error {error.value!r}")
+
+    def expect(widget, label):
+        # A missing widget means the page did not render as expected; the
+        # run would otherwise pass with only the initial load measured.
+        if widget is None:
+            errors.append(f"missing widget {label!r}")
+        return widget
+
+    timed("initial load", at.run)
+
+    # AppTest does not fire the polling fragment, so rerun once the
+    # background validation has finished to render its result.
+    from src import validator
+
+    key = validator.file_hash(payload.decode("utf-8"))
+    deadline = time.monotonic() + VALIDATION_WAIT_SECONDS
+    while validator.poll_validation(key)[0] == "pending":
+        if time.monotonic() > deadline:
+            errors.append("validation did not finish")
+            break
+        time.sleep(0.05)
+    timed("show validation", at.run)
+    if "validation_outcome" not in at.session_state:
+        errors.append("validation result was not shown")
+
+    label = "Select a run to view details"
+    run_select = expect(_find(at.selectbox, label), label)
+    if run_select is not None:
+        for option in run_select.options[1 : steps + 1]:
+            timed("select run", lambda: run_select.set_value(option).run())
+            run_select = expect(_find(at.selectbox, label), label)
+            if run_select is None:
+                break
+
+    label = "Enable Comparison Mode"
+    toggle = expect(_find(at.toggle, label), label)
+    if toggle is not None:
+        timed("toggle comparison", lambda: toggle.set_value(True).run())
+        label = "Select metric to compare"
+        metric_select = expect(_find(at.selectbox, label), label)
+        if metric_select is not None:
+            for option in metric_select.options[1 : steps + 1]:
+                timed("select metric", lambda: metric_select.set_value(option).run())
+                metric_select = expect(_find(at.selectbox, label), label)
+                if metric_select is None:
+                    break
+    return errors
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))]
+
+    return {
+        "count": len(ordered),
+        "p50": statistics.median(ordered),
+        "p90": pct(90),
+        "p95": pct(95),
+        "p99": pct(99),
+        "max": ordered[-1],
+    }
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def cache_report():
+    from src import main, validator
+
+    def rates(counts):
+        hits, misses = counts["hits"], counts["misses"]
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else None,
+        }
+
+    return {
+        "validation_jobs": rates(validator.cache_stats),
+        # Parsed file, comparison data and report kept per session.
+        "session_memo": {name: rates(c) for name, c in main.memo_stats.items()},
+    }
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--sessions", type=int, default=4)
+    arg_parser.add_argument("--runs", type=int, default=10)
+    arg_parser.add_argument("--scalar-metrics", type=int, default=8)
+    arg_parser.add_argument("--list-metrics", type=int, default=2)
+    arg_parser.add_argument("--list-length", type=int, default=500)
+    arg_parser.add_argument(
+        "--distinct-files",
+        type=int,
+        default=2,
+        help="number of different files shared among the sessions",
+    )
+    arg_parser.add_argument("--steps", type=int, default=3)
+    arg_parser.add_argument("--timeout", type=float, default=120)
+    arg_parser.add_argument("--max-p95-ms", type=float, default=None)
+    arg_parser.add_argument("--json", action="store_true", help="print JSON only")
+    args = arg_parser.parse_args(argv)
+
+    # AppTest switches this option on for each run and back off afterwards,
+    # which races between concurrent sessions; keep it on for the whole test.
+    from streamlit import config
+
+    config.set_option("global.appTest", True)
+    stub_network_validation()
+    latencies = {}
+    counters = {"empty_page_retries": 0}
+    lock = threading.Lock()
+    instrument_fragments(latencies, lock)
+    payloads = [
+        make_synthetic_mzqc(
+            args.runs, args.scalar_metrics, args.list_metrics, args.list_length, seed
+        ).encode("utf-8")
+        for seed in range(max(1, args.distinct_files))
+    ]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+        futures = [
+            pool.submit(
+                run_session,
+                payloads[i % len(payloads)],
+                args.steps,
+                args.timeout,
+                latencies,
+                lock,
+                counters,
+            )
+            for i in range(args.sessions)
+        ]
+        errors = [error for future in futures for error in future.result()]
+    elapsed = time.perf_counter() - start
+
+    interactions = {
+        k: v for k, v in latencies.items() if not k.startswith(FRAGMENT_PREFIX)
+    }
+    reruns = [ms for samples in interactions.values() for ms in samples]
+    report = {
+        "sessions": args.sessions,
+        "wall_time_s": elapsed,
+        "peak_rss_mb": peak_rss_mb(),
+        "rerun_latency_ms": percentiles(reruns) if reruns else None,
+        "by_interaction_ms": {k: percentiles(v) for k, v in interactions.items()},
+        # What a fragment-scoped rerun executes in a live app.
+        "fragment_body_ms": {
+            k[len(FRAGMENT_PREFIX) :]: percentiles(v)
+            for k, v in latencies.items()
+            if k.startswith(FRAGMENT_PREFIX)
+        },
+        "caches": cache_report(),
+        **counters,
+        "errors": errors,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"sessions: {args.sessions}, wall time {elapsed:.1f} s")
+        print(f"peak RSS: {report['peak_rss_mb']:.0f} MB")
+        print(f"{'interaction':<36}{'n':>5}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}")
+        rows = list(report["by_interaction_ms"].items())
+        if reruns:
+            rows.append(("all reruns", report["rerun_latency_ms"]))
+        rows += [
+            (FRAGMENT_PREFIX + k, p) for k, p in report["fragment_body_ms"].items()
+        ]
+        for kind, p in rows:
+            print(
+                f"{kind:<36}{p['count']:>5}{p['p50']:>9.0f}{p['p90']:>9.0f}"
+                f"{p['p99']:>9.0f}{p['max']:>9.0f}"
+            )
+        print(f"caches: {json.dumps(report['caches'])}")
+        if counters["empty_page_retries"]:
+            print(f"empty pages rerun: {counters['empty_page_retries']}")
+        for error in errors:
+            print(f"error: {error}")
+
+    if errors:
+        return 1
+    if args.max_p95_ms is not None and reruns:
+        if report["rerun_latency_ms"]["p95"] > args.max_p95_ms:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Measure throughput and latency of a running mzQC HTTP service.
+
+Start the service first (``python serve.py``), then for example::
+
+    python benchmarks/load_test_service.py run.mzQC --endpoint /parse \
+        --requests 500 --concurrency 16 --unique
+"""
+
+import argparse
+import statistics
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def send(url, body):
+    request = urllib.request.Request(
+        url, data=body, headers={"Content-Type": "application/json"}
+    )
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except urllib.error.URLError:
+        status = "connection error"
+    return status, time.perf_counter() - start
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("file", help="mzQC file to send")
+    arg_parser.add_argument("--url", default="http://127.0.0.1:8600")
+    arg_parser.add_argument("--endpoint", default="/validate")
+    arg_parser.add_argument("--requests", type=int, default=200)
+    arg_parser.add_argument("--concurrency", type=int, default=8)
+    arg_parser.add_argument(
+        "--unique",
+        action="store_true",
+        help="make every body distinct (trailing whitespace) to bypass the cache",
+    )
+    args = arg_parser.parse_args(argv)
+
+    with open(args.file, "rb") as fh:
+        payload = fh.read()
+    bodies = [
+        payload + b" " * i if args.unique else payload for i in range(args.requests)
+    ]
+    url = args.url.rstrip("/") + args.endpoint
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(lambda body: send(url, body), bodies))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency * 1000 for status, latency in results if status == 200]
+    statuses = Counter(status for status, _ in results)
+    print(f"requests:     {len(results)} in {elapsed:.2f}s")
+    print(f"throughput:   {len(results) / elapsed:.1f} req/s")
+    print(f"status codes: {dict(statuses)}")
+    if latencies:
+        print(f"latency p50:  {statistics.median(latencies):.1f} ms")
+        print(f"latency p95:  {percentile(latencies, 95):.1f} ms")
+        print(f"latency p99:  {percentile(latencies, 99):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from src import service
+
+if __name__ == "__main__":
+    service.main()
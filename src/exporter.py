@@ -0,0 +1,237 @@
+import io
+import json
+import math
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, List, Union
+
+import pandas as pd
+
+from src import utils
+
+ExportTarget = Union[str, BinaryIO]
+
+EXPORT_COLUMNS = [
+    "run_index",
+    "run_label",
+    "input_file",
+    "software",
+    "accession",
+    "name",
+    "unit_name",
+    "unit_accession",
+    "column",
+    "element_index",
+    "value",
+    "value_text",
+]
+
+EXPORT_FORMATS = {
+    "parquet": ("Parquet", "parquet", "application/vnd.apache.parquet"),
+    "csv": ("CSV", "csv", "text/csv"),
+    "xlsx": (
+        "Excel",
+        "xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+}
+
+DEFAULT_CHUNK_ROWS = 50_000
+XLSX_MAX_ROWS = 1_048_576
+
+
+def _split_value(x: Any) -> Dict[str, Any]:
+    """Place a scalar into the numeric or the text value column."""
+    if x is None or (isinstance(x, float) and math.isnan(x)):
+        return {"value": None, "value_text": None}
+    if utils.is_number(x):
+        return {"value": float(x), "value_text": None}
+    if isinstance(x, str):
+        return {"value": None, "value_text": x}
+    return {"value": None, "value_text": json.dumps(x, default=str)}
+
+
+def _metric_rows(base: Dict[str, Any], value: Any) -> Iterator[Dict[str, Any]]:
+    """Flatten one metric value into tidy rows.
+
+    Lists become one row per element and table metrics (dicts of columns)
+    one row per cell, so every exported value is a scalar. Empty lists and
+    tables still give one row without a value, so the metric is not lost.
+    """
+    if isinstance(value, (list, dict)) and not value:
+        yield {**base, "column": None, "element_index": None, **_split_value(None)}
+    elif isinstance(value, dict) and all(isinstance(v, list) for v in value.values()):
+        for column, cells in value.items():
+            for i, cell in enumerate(cells):
+                yield {
+                    **base,
+                    "column": str(column),
+                    "element_index": i,
+                    **_split_value(cell),
+                }
+    elif isinstance(value, list):
+        for i, element in enumerate(value):
+            yield {**base, "column": None, "element_index": i, **_split_value(element)}
+    else:
+        yield {**base, "column": None, "element_index": None, **_split_value(value)}
+
+
+def _to_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    df = pd.DataFrame(rows, columns=EXPORT_COLUMNS)
+    return df.astype({"element_index": "Int64", "value": "float64"})
+
+
+def iter_export_chunks(
+    metadata_list: List[Dict[str, str]],
+    metric_dfs: List[pd.DataFrame],
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """Yield all runs as long-format DataFrames of at most ``chunk_rows`` rows."""
+    rows: List[Dict[str, Any]] = []
+    for i, (meta, df) in enumerate(zip(metadata_list, metric_dfs)):
+        if df is None or df.empty:
+            continue
+        df = utils.clean_metrics_df(df)
+        run_fields = {
+            "run_index": i + 1,
+            "run_label": meta["label"],
+            "input_file": meta["input_file"],
+            "software": meta["software"],
+        }
+        for record in df.to_dict(orient="records"):
+            base = {
+                **run_fields,
+                "accession": record.get("accession"),
+                "name": record.get("name"),
+                "unit_name": record.get("unit_name"),
+                "unit_accession": record.get("unit_accession"),
+            }
+            for row in _metric_rows(base, record.get("value")):
+                rows.append(row)
+                if len(rows) >= chunk_rows:
+                    yield _to_frame(rows)
+                    rows = []
+    if rows:
+        yield _to_frame(rows)
+
+
+@contextmanager
+def _text_stream(dest: ExportTarget) -> Iterator[io.TextIOBase]:
+    if isinstance(dest, str):
+        with open(dest, "w", encoding="utf-8", newline="") as fh:
+            yield fh
+    else:
+        wrapper = io.TextIOWrapper(dest, encoding="utf-8", newline="")
+        try:
+            yield wrapper
+        finally:
+            wrapper.flush()
+            wrapper.detach()
+
+
+def _write_csv(chunks: Iterator[pd.DataFrame], dest: ExportTarget) -> int:
+    total = 0
+    with _text_stream(dest) as fh:
+        fh.write(",".join(EXPORT_COLUMNS) + "\n")
+        for chunk in chunks:
+            chunk.to_csv(fh, header=False, index=False)
+            total += len(chunk)
+    return total
+
+
+def _write_parquet(chunks: Iterator[pd.DataFrame], dest: ExportTarget) -> int:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError(f"Parquet export requires pyarrow: {e}")
+
+    schema = pa.schema(
+        [
+            ("run_index", pa.int64()),
+            ("run_label", pa.string()),
+            ("input_file", pa.string()),
+            ("software", pa.string()),
+            ("accession", pa.string()),
+            ("name", pa.string()),
+            ("unit_name", pa.string()),
+            ("unit_accession", pa.string()),
+            ("column", pa.string()),
+            ("element_index", pa.int64()),
+            ("value", pa.float64()),
+            ("value_text", pa.string()),
+        ]
+    )
+    total = 0
+    with pq.ParquetWriter(dest, schema) as writer:
+        for chunk in chunks:
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            writer.write_table(table)
+            total += len(chunk)
+    return total
+
+
+def _write_xlsx(chunks: Iterator[pd.DataFrame], dest: ExportTarget) -> int:
+    try:
+        from openpyxl import Workbook
+    except ImportError as e:
+        raise RuntimeError(f"Excel export requires openpyxl: {e}")
+
+    # Write-only workbooks stream rows to disk instead of keeping them in memory.
+    wb = Workbook(write_only=True)
+    ws = None
+    sheet_rows = XLSX_MAX_ROWS
+    total = 0
+    for chunk in chunks:
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for row in chunk.itertuples(index=False, name=None):
+            if sheet_rows >= XLSX_MAX_ROWS:
+                ws = wb.create_sheet(f"metrics_{len(wb.worksheets) + 1}")
+                ws.append(EXPORT_COLUMNS)
+                sheet_rows = 1
+            ws.append(row)
+            sheet_rows += 1
+            total += 1
+    if ws is None:
+        wb.create_sheet("metrics_1").append(EXPORT_COLUMNS)
+    wb.save(dest)
+    return total
+
+
+_WRITERS = {
+    "csv": _write_csv,
+    "parquet": _write_parquet,
+    "xlsx": _write_xlsx,
+}
+
+
+def export_runs(
+    metadata_list: List[Dict[str, str]],
+    metric_dfs: List[pd.DataFrame],
+    dest: ExportTarget,
+    fmt: str = "parquet",
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> int:
+    """Export every metric of every run as one long-format dataset.
+
+    ``dest`` may be a file path or a binary file object. Rows are produced
+    and written chunk by chunk, so memory use is bounded by ``chunk_rows``
+    rather than by the number of runs. Returns the number of rows written.
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(
+            f"Unsupported export format '{fmt}'. Choose from: {', '.join(_WRITERS)}"
+        )
+    chunks = iter_export_chunks(metadata_list, metric_dfs, chunk_rows)
+    return _WRITERS[fmt](chunks, dest)
+
+
+def export_runs_to_bytes(
+    metadata_list: List[Dict[str, str]],
+    metric_dfs: List[pd.DataFrame],
+    fmt: str = "parquet",
+) -> bytes:
+    """Export all runs into an in-memory file, e.g. for a download button."""
+    buffer = io.BytesIO()
+    export_runs(metadata_list, metric_dfs, buffer, fmt=fmt)
+    return buffer.getvalue()
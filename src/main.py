@@ -1,11 +1,12 @@
 import streamlit as st
-from src import parser, validator, utils
+from src import parser, validator, utils, exporter, watcher, stats
 import pandas as pd
-import altair as alt
+
+VALIDATION_POLL_SECONDS = 1.0
 
 
 def is_numeric_value(x):
-    return isinstance(x, (int, float))
+    return utils.is_number(x)
 
 
 def categorize_metrics(df):
@@ -33,26 +34,614 @@ def create_comparison_df(metric_dfs, metadata_list, selected_runs):
     return None
 
 
+def run_ids(metadata_list):
+    """Stable identifiers of the runs: source file and label.
+
+    Unlike positions, they survive runs being added, removed or re-ingested.
+    """
+    ids, seen = [], {}
+    for meta in metadata_list:
+        run_id = f"{meta.get('source_file', '')}/{meta['label']}"
+        seen[run_id] = seen.get(run_id, 0) + 1
+        ids.append(run_id if seen[run_id] == 1 else f"{run_id}#{seen[run_id]}")
+    return ids
+
+
+# Hits and misses of session_memo per name, across all sessions.
+memo_stats = {}
+
+
+def session_memo(name, key, build):
+    """Return ``build()``, reused from session state while ``key`` is unchanged."""
+    counts = memo_stats.setdefault(name, {"hits": 0, "misses": 0})
+    cached = st.session_state.get(name)
+    if cached is None or cached[0] != key:
+        counts["misses"] += 1
+        cached = (key, build())
+        st.session_state[name] = cached
+    else:
+        counts["hits"] += 1
+    return cached[1]
+
+
 def show(chart):
     """Display an Altair chart with full width."""
     st.altair_chart(chart, use_container_width=True)
 
 
+def render_validation_result(state, result):
+    """Display the outcome of a background validation job."""
+    if state == "timeout":
+        timeout = validator.VALIDATION_TIMEOUT
+        st.warning(
+            f"⚠ Validation did not finish within {timeout} seconds. It keeps "
+            "running; upload the file again later to see the result."
+        )
+        return
+    if state != "done":
+        error = result["error"] if result else "no validation job found"
+        st.error(f"❌ Error during validation: {error}")
+        return
+
+    if result["schema_valid"]:
+        st.success(result["schema_message"])
+    else:
+        st.error(result["schema_message"])
+
+    semantic = result["semantic"]
+    if not semantic:
+        st.success("✔ No semantic issues found.")
+    for category, issues in semantic.items():
+        with st.expander(f"⚠ Semantic check: {category} ({len(issues)})"):
+            for issue in issues:
+                st.write(f"- {issue}")
+
+
+def show_validation(json_str):
+    """Show validation findings, polling until the background job finishes.
+
+    The final outcome is kept in session state, so later reruns render it
+    without submitting the file again. Uploading the file anew starts a new
+    job, e.g. after a timeout or while the schema could not be downloaded.
+    """
+    validation_key = validator.file_hash(json_str)
+    outcome = st.session_state.get("validation_outcome")
+    if outcome is not None and outcome[0] == validation_key:
+        render_validation_result(*outcome[1:])
+        return
+
+    try:
+        validator.submit_validation(json_str)
+    except validator.ValidationBusyError as e:
+        # Not kept as the outcome, so the next rerun tries again.
+        st.warning(f"⚠ {e}")
+        return
+    state, _ = validator.poll_validation(validation_key)
+    run_every = VALIDATION_POLL_SECONDS if state == "pending" else None
+
+    @st.fragment(run_every=run_every)
+    def validation_panel():
+        state, result = validator.poll_validation(validation_key)
+        if state == "pending":
+            st.info("⏳ Running schema and semantic validation…")
+            return
+        st.session_state["validation_outcome"] = (validation_key, state, result)
+        if run_every is not None:
+            # Rerun the page once so that the panel stops polling.
+            st.rerun()
+        render_validation_result(state, result)
+
+    validation_panel()
+
+
+def render_numeric_comparison(metric_data):
+    """Bar chart and table of one numeric metric across runs."""
+    # Altair is only needed once there is data to chart.
+    import altair as alt
+
+    # Calculate height for chart
+    min_height = 100  # Minimum height in pixels
+    height_per_run = 60  # Height per run
+    chart_height = max(
+        min_height,
+        len(metric_data) * height_per_run,
+    )
+
+    chart = (
+        alt.Chart(metric_data)
+        .encode(
+            y=alt.Y(
+                "run:N",
+                title=None,
+                axis=alt.Axis(
+                    labelColor="white",
+                    labelFontSize=12,
+                    labelLimit=200,
+                    labelPadding=10,
+                ),
+            ),
+            x=alt.X(
+                "value:Q",
+                title="Value",
+                axis=alt.Axis(
+                    labelColor="white",
+                    gridColor="#333",
+                    tickColor="white",
+                ),
+            ),
+            tooltip=["run", "value"],
+        )
+        .properties(height=chart_height, width=600)
+    )
+
+    bars = chart.mark_bar(color="#7FB3D5", height=20)
+
+    text = chart.mark_text(
+        align="left",
+        baseline="middle",
+        dx=5,
+        color="white",
+        fontSize=12,
+    ).encode(text=alt.Text("value:Q", format=".2f"))
+
+    # Configure chart padding
+    padding_config = {
+        "left": 10,
+        "right": 30,
+        "top": 10,
+        "bottom": 10,
+    }
+
+    final_chart = (
+        alt.layer(bars, text)
+        .properties(padding=padding_config)
+        .configure_view(strokeWidth=0)
+        .configure(background="#1E1E1E")
+    )
+
+    # Display chart
+    show(final_chart)
+
+    # Show comparison table
+    st.write("**Detailed Comparison**")
+    st.dataframe(
+        metric_data[["run", "value"]],
+        column_config={
+            "value": st.column_config.NumberColumn(
+                "value",
+                help="Metric value",
+            )
+        },
+    )
+
+
+def render_list_comparison(metric_stats):
+    """Box plot, histogram and table of one list metric across runs.
+
+    Everything is drawn from the precomputed summary statistics, so the raw
+    lists are never sent to the browser.
+    """
+    import altair as alt
+
+    chart_height = max(100, len(metric_stats) * 60)
+    axis = alt.Axis(labelColor="white", gridColor="#333", tickColor="white")
+    base = alt.Chart(metric_stats).encode(
+        y=alt.Y(
+            "run:N",
+            title=None,
+            axis=alt.Axis(labelColor="white", labelFontSize=12, labelLimit=200),
+        )
+    )
+    whiskers = base.mark_rule(color="white").encode(
+        x=alt.X("min:Q", title="Value", axis=axis), x2="max:Q"
+    )
+    box = base.mark_bar(color="#7FB3D5", height=20).encode(
+        x="q1:Q", x2="q3:Q", tooltip=["run"] + stats.STAT_COLUMNS
+    )
+    median = base.mark_tick(color="white", thickness=2, size=20).encode(x="median:Q")
+    show(
+        alt.layer(whiskers, box, median)
+        .properties(height=chart_height, width=600)
+        .configure_view(strokeWidth=0)
+        .configure(background="#1E1E1E")
+    )
+
+    histogram = (
+        alt.Chart(stats.histogram_df(metric_stats))
+        .mark_bar(opacity=0.6)
+        .encode(
+            x=alt.X("bin_start:Q", bin="binned", title="Value", axis=axis),
+            x2="bin_end:Q",
+            y=alt.Y("count:Q", stack=None, title="Count", axis=axis),
+            color=alt.Color("run:N", title=None),
+            tooltip=["run", "bin_start", "bin_end", "count"],
+        )
+        .properties(height=200, width=600)
+        .configure_view(strokeWidth=0)
+        .configure(background="#1E1E1E")
+    )
+    show(histogram)
+
+    st.write("**Distribution Summary**")
+    st.dataframe(metric_stats[["run"] + stats.STAT_COLUMNS], hide_index=True)
+
+
+@st.fragment
+def render_metric_comparison(metadata_list, comparison_df, list_stats, data_key):
+    """Metric picker, report export and chart for the selected runs.
+
+    Runs as its own fragment, so picking another metric only rebuilds the
+    chart and not the per-run comparison data. ``data_key`` identifies the
+    data and selected runs; the report is only regenerated when it changes.
+    """
+    # A metric name can be numeric in some runs and a list in others, so
+    # both kinds get their own option.
+    options = {}
+    if comparison_df is not None:
+        for name in comparison_df["name"].unique():
+            options[name] = ("numeric", name)
+    if list_stats is not None:
+        for name in list_stats["name"].unique():
+            options[f"{name} (list)"] = ("list", name)
+
+    if options:
+        kind, selected_metric = options[
+            st.selectbox("Select metric to compare", list(options))
+        ]
+
+        # Add export button for comparison report
+        report = session_memo(
+            "comparison_report",
+            (data_key, selected_metric),
+            lambda: utils.generate_comparison_report_html(
+                metadata_list,
+                comparison_df,
+                selected_metric,
+                list_stats,
+            ),
+        )
+        st.download_button(
+            "📥 Export Comparison Report",
+            report,
+            file_name="mzqc_comparison_report.html",
+            mime="text/html",
+        )
+
+        st.write(f"**Comparing {selected_metric}**")
+        if kind == "list":
+            render_list_comparison(list_stats[list_stats["name"] == selected_metric])
+        else:
+            render_numeric_comparison(
+                comparison_df[comparison_df["name"] == selected_metric]
+            )
+
+
+@st.fragment
+def render_comparison_view(metadata_list, metric_dfs, data_version):
+    """Compare metrics across the selected runs.
+
+    ``data_version`` changes whenever the runs change; until then the
+    comparison data of a selection is reused across reruns.
+    """
+    st.subheader("🔄 Run Comparison")
+
+    # Run selection, kept by run id so that it survives changes to the runs
+    ids = run_ids(metadata_list)
+    run_options = {
+        run_id: f"Run {i+1}: {md['label']}"
+        for i, (run_id, md) in enumerate(zip(ids, metadata_list))
+    }
+    previous = st.session_state.get("compare_runs")
+    kept = [r for r in previous or [] if r in run_options]
+    if not kept and previous != []:
+        # First view, or none of the runs are left (e.g. another file was
+        # uploaded): start with the first two runs.
+        kept = ids[:2]
+    st.session_state["compare_runs"] = kept
+    selected_ids = st.multiselect(
+        "Select runs to compare",
+        options=ids,
+        format_func=run_options.get,
+        max_selections=5,  # Limit to 5 runs for readability
+        key="compare_runs",
+    )
+
+    if selected_ids:
+        selected_runs = [ids.index(run_id) for run_id in selected_ids]
+        data_key = (data_version, tuple(selected_ids))
+        comparison_df, list_stats = session_memo(
+            "comparison_data",
+            data_key,
+            lambda: (
+                create_comparison_df(
+                    metric_dfs,
+                    metadata_list,
+                    selected_runs,
+                ),
+                stats.summarize_list_metrics(
+                    metric_dfs,
+                    metadata_list,
+                    selected_runs,
+                ),
+            ),
+        )
+
+        render_metric_comparison(metadata_list, comparison_df, list_stats, data_key)
+    else:
+        msg = "Please select at least one run to compare."
+        st.warning(msg)
+
+
+@st.fragment
+def render_run_view(metadata_list, metric_dfs, data_version):
+    """Show the metrics of a single selected run.
+
+    The run report is generated once per file and run, not on every rerun
+    of this fragment (e.g. after a click on one of its download buttons).
+    """
+    import altair as alt
+
+    run_options = [f"Run {i+1}: {md['label']}" for i, md in enumerate(metadata_list)]
+    selected_run = st.selectbox(
+        "Select a run to view details",
+        range(len(run_options)),
+        format_func=lambda i: run_options[i],
+    )
+
+    # Process and categorize metrics
+    metrics = metric_dfs[selected_run]
+    df_metrics = utils.clean_metrics_df(metrics)
+    result = categorize_metrics(df_metrics)
+    numeric_df, list_df, other_df = result
+
+    # Display run metadata
+    st.subheader("📋 Run Metadata")
+
+    # Add export button for single run report
+    report = session_memo(
+        "run_report",
+        (data_version, selected_run),
+        lambda: utils.generate_run_report_html(
+            metadata_list[selected_run],
+            numeric_df,
+            list_df,
+            other_df,
+        ),
+    )
+    st.download_button(
+        "📥 Export Run Report",
+        report,
+        file_name=f"mzqc_run_{selected_run+1}_report.html",
+        mime="text/html",
+    )
+
+    # Display metadata fields
+    run_data = metadata_list[selected_run]
+    st.write(f"**Label**: {run_data['label']}")
+    st.write(f"**Input File**: {run_data['input_file']}")
+    st.write(f"**Software**: {run_data['software']}")
+
+    # Display numeric metrics
+    if not numeric_df.empty:
+        st.subheader("📊 Numeric Metrics")
+        st.dataframe(
+            numeric_df,
+            column_config={
+                "value": st.column_config.NumberColumn(
+                    "value",
+                    help="Metric value",
+                )
+            },
+        )
+
+        # Visualize numeric metrics
+        st.subheader("📈 Metrics Visualization")
+        for _, row in numeric_df.iterrows():
+            metric_name = row["name"]
+            value = row["value"]
+
+            st.write(f"**{metric_name}**")
+
+            metric_df = pd.DataFrame(
+                {
+                    "Metric": [metric_name],
+                    "Value": [value],
+                }
+            )
+
+            x_domain = [0, value * 1.1]
+
+            base = (
+                alt.Chart(metric_df)
+                .encode(
+                    y=alt.Y(
+                        "Metric:N",
+                        title=None,
+                        axis=alt.Axis(
+                            labelColor="white",
+                            labelFontSize=12,
+                            labelLimit=200,
+                        ),
+                    ),
+                    x=alt.X(
+                        "Value:Q",
+                        title="Value",
+                        scale=alt.Scale(domain=x_domain),
+                        axis=alt.Axis(
+                            labelColor="white",
+                            gridColor="#333",
+                            tickColor="white",
+                        ),
+                    ),
+                    tooltip=["Metric", "Value"],
+                )
+                .properties(height=30, width=600)
+            )
+
+            bar = base.mark_bar(color="#7FB3D5", height=8)
+
+            text = base.mark_text(
+                align="left",
+                baseline="middle",
+                dx=5,
+                color="white",
+                fontSize=12,
+            ).encode(text=alt.Text("Value:Q", format=".2f"))
+
+            final_chart = (
+                alt.layer(bar, text)
+                .configure_view(strokeWidth=0)
+                .configure(background="#1E1E1E")
+            )
+
+            show(final_chart)
+
+    # Display list metrics
+    if not list_df.empty:
+        col1, col2 = st.columns([0.85, 0.15])
+        with col1:
+            st.subheader("📋 List Metrics")
+        with col2:
+            st.download_button(
+                "⬇ Download CSV",
+                data=list_df.to_csv(index=False),
+                file_name="list_metrics.csv",
+                mime="text/csv",
+                key="list_download",
+            )
+
+        for _, row in list_df.iterrows():
+            with st.expander(f"{row['name']}"):
+                st.write("Values:")
+                st.json(row["value"])
+
+    # Display other metrics
+    if not other_df.empty:
+        col1, col2 = st.columns([0.85, 0.15])
+        with col1:
+            st.subheader("📑 Other Metrics")
+        with col2:
+            st.download_button(
+                "⬇ Download CSV",
+                data=other_df.to_csv(index=False),
+                file_name="other_metrics.csv",
+                mime="text/csv",
+                key="other_download",
+            )
+
+        for _, row in other_df.iterrows():
+            with st.expander(f"{row['name']}"):
+                st.write("Value:")
+                st.code(str(row["value"]))
+
+
+def load_mzqc(json_str, digest):
+    """Parse an uploaded file once and keep the result in session state.
+
+    Reruns reuse the parsed runs as long as the file content is unchanged.
+    """
+    return session_memo("mzqc_data", digest, lambda: parser.parse_mzqc(json_str))
+
+
+@st.fragment
+def render_export_panel(metadata_list, metric_dfs):
+    """Bulk export of all runs; the form keeps format changes from rerunning."""
+    with st.expander("📦 Export all runs"):
+        with st.form("export_form", border=False):
+            export_fmt = st.selectbox(
+                "Export format",
+                list(exporter.EXPORT_FORMATS),
+                format_func=lambda f: exporter.EXPORT_FORMATS[f][0],
+            )
+            prepare = st.form_submit_button("Prepare export")
+        if prepare:
+            label, ext, mime = exporter.EXPORT_FORMATS[export_fmt]
+            st.download_button(
+                f"📥 Download {label}",
+                exporter.export_runs_to_bytes(
+                    metadata_list,
+                    metric_dfs,
+                    fmt=export_fmt,
+                ),
+                file_name=f"mzqc_all_runs.{ext}",
+                mime=mime,
+            )
+
+
+def render_watch_view(directory):
+    """Live dashboard of the runs ingested from a watched folder."""
+    try:
+        poll_seconds = watcher.start_watcher(directory).poll_seconds
+    except watcher.WatcherLimitError as e:
+        st.error(f"❌ {e}")
+        return
+
+    @st.fragment(run_every=poll_seconds)
+    def live_dashboard():
+        # Refreshes only look the watcher up; starting one is left to a full
+        # rerun, so that refreshes never re-ingest a stopped folder.
+        folder_watcher = watcher.get_watcher(directory)
+        if folder_watcher is None:
+            st.warning("⚠ This folder is no longer watched. Reload to watch it.")
+            return
+        index = folder_watcher.index
+        status_df = index.file_status()
+        metadata_list, metric_dfs, version = index.snapshot()
+
+        st.subheader("📡 Watched Files")
+        st.caption(
+            f"{len(status_df)} files, {len(metadata_list)} runs "
+            f"(checking every {poll_seconds:.0f} s)"
+        )
+        st.dataframe(status_df, hide_index=True)
+
+        if metadata_list:
+            render_comparison_view(metadata_list, metric_dfs, version)
+        else:
+            st.info("Waiting for mzQC files…")
+
+    live_dashboard()
+
+
 def main():
     st.set_page_config(page_title="mzQC Visualizer", layout="wide")
     st.title("🧪 mzQC Visualizer")
 
+    source = st.sidebar.radio("Input", ["Upload file", "Watch folder"])
+    if source == "Watch folder":
+        roots = watcher.watch_roots()
+        if not roots:
+            st.info(
+                "Watching folders is disabled. Set the "
+                f"`{watcher.WATCH_ROOTS_ENV}` environment variable to the "
+                "directories whose folders may be watched."
+            )
+            return
+        directory = st.sidebar.text_input(
+            "📁 Folder to watch", help=f"A folder within {', '.join(roots)}"
+        )
+        path = watcher.resolve_watch_dir(directory) if directory else None
+        if not directory:
+            st.info("Enter a folder in the sidebar to start watching it.")
+        elif path is None:
+            st.error(f"❌ `{directory}` is not a folder within the watch roots.")
+        else:
+            render_watch_view(path)
+        return
+
     uploaded_file = st.file_uploader("📂 Upload a `.mzQC` file", type="mzQC")
 
-    if uploaded_file is not None:
+    if uploaded_file is None:
+        st.session_state.pop("validation_outcome", None)
+    else:
         json_str = uploaded_file.read().decode("utf-8")
-        is_valid, validation_msg = validator.validate_mzqc(json_str)
+        # Validation runs in the background while the file is rendered.
+        show_validation(json_str)
 
-        if is_valid:
-            st.success(validation_msg)
-            result = parser.parse_mzqc(json_str)
-            metadata_list, metric_dfs, file_metadata = result
+        digest = validator.file_hash(json_str)
+        metadata_list, metric_dfs, file_metadata = load_mzqc(json_str, digest)
 
+        if metadata_list is not None:
             st.subheader("📄 File Metadata")
             st.write(f"**Version**: {file_metadata['version']}")
             st.write(f"**Contact Name**: {file_metadata['contactName']}")
@@ -63,6 +652,8 @@ def main():
             if not metadata_list:
                 st.warning("No runs found in the file.")
             else:
+                render_export_panel(metadata_list, metric_dfs)
+
                 # Mode selection
                 if len(metadata_list) > 1:
                     comparison_mode = st.toggle(
@@ -74,288 +665,12 @@ def main():
                     comparison_mode = False
 
                 if comparison_mode:
-                    st.subheader("🔄 Run Comparison")
-
-                    # Run selection
-                    run_options = [
-                        f"Run {i+1}: {md['label']}"
-                        for i, md in enumerate(metadata_list)
-                    ]
-                    selected_runs = st.multiselect(
-                        "Select runs to compare",
-                        options=range(len(run_options)),
-                        default=[0, 1] if len(metadata_list) > 1 else [0],
-                        format_func=lambda i: run_options[i],
-                        max_selections=5,  # Limit to 5 runs for readability
-                    )
-
-                    if selected_runs:
-                        comparison_df = create_comparison_df(
-                            metric_dfs,
-                            metadata_list,
-                            selected_runs,
-                        )
-
-                        if comparison_df is not None:
-                            # Get unique metric names
-                            metric_names = comparison_df["name"].unique()
-                            selected_metric = st.selectbox(
-                                "Select metric to compare",
-                                metric_names,
-                            )
-
-                            # Add export button for comparison report
-                            st.download_button(
-                                "📥 Export Comparison Report",
-                                utils.generate_comparison_report_html(
-                                    metadata_list,
-                                    comparison_df,
-                                    selected_metric,
-                                ),
-                                file_name="mzqc_comparison_report.html",
-                                mime="text/html",
-                            )
-
-                            # Filter data for selected metric
-                            metric_data = comparison_df[
-                                comparison_df["name"] == selected_metric
-                            ]
-
-                            # Create comparison chart
-                            st.write(f"**Comparing {selected_metric}**")
-
-                            # Calculate height for chart
-                            min_height = 100  # Minimum height in pixels
-                            height_per_run = 60  # Height per run
-                            chart_height = max(
-                                min_height,
-                                len(metric_data) * height_per_run,
-                            )
-
-                            chart = (
-                                alt.Chart(metric_data)
-                                .encode(
-                                    y=alt.Y(
-                                        "run:N",
-                                        title=None,
-                                        axis=alt.Axis(
-                                            labelColor="white",
-                                            labelFontSize=12,
-                                            labelLimit=200,
-                                            labelPadding=10,
-                                        ),
-                                    ),
-                                    x=alt.X(
-                                        "value:Q",
-                                        title="Value",
-                                        axis=alt.Axis(
-                                            labelColor="white",
-                                            gridColor="#333",
-                                            tickColor="white",
-                                        ),
-                                    ),
-                                    tooltip=["run", "value"],
-                                )
-                                .properties(height=chart_height, width=600)
-                            )
-
-                            bars = chart.mark_bar(color="#7FB3D5", height=20)
-
-                            text = chart.mark_text(
-                                align="left",
-                                baseline="middle",
-                                dx=5,
-                                color="white",
-                                fontSize=12,
-                            ).encode(text=alt.Text("value:Q", format=".2f"))
-
-                            # Configure chart padding
-                            padding_config = {
-                                "left": 10,
-                                "right": 30,
-                                "top": 10,
-                                "bottom": 10,
-                            }
-
-                            final_chart = (
-                                alt.layer(bars, text)
-                                .properties(padding=padding_config)
-                                .configure_view(strokeWidth=0)
-                                .configure(background="#1E1E1E")
-                            )
-
-                            # Display chart
-                            show(final_chart)
-
-                            # Show comparison table
-                            st.write("**Detailed Comparison**")
-                            st.dataframe(
-                                metric_data[["run", "value"]],
-                                column_config={
-                                    "value": st.column_config.NumberColumn(
-                                        "value",
-                                        help="Metric value",
-                                    )
-                                },
-                            )
-                    else:
-                        msg = "Please select at least one run to compare."
-                        st.warning(msg)
-
+                    render_comparison_view(metadata_list, metric_dfs, digest)
                 else:  # Individual run view
-                    run_options = [
-                        f"Run {i+1}: {md['label']}"
-                        for i, md in enumerate(metadata_list)
-                    ]
-                    selected_run = st.selectbox(
-                        "Select a run to view details",
-                        range(len(run_options)),
-                        format_func=lambda i: run_options[i],
-                    )
-
-                    # Process and categorize metrics
-                    metrics = metric_dfs[selected_run]
-                    df_metrics = utils.clean_metrics_df(metrics)
-                    result = categorize_metrics(df_metrics)
-                    numeric_df, list_df, other_df = result
-
-                    # Display run metadata
-                    st.subheader("📋 Run Metadata")
-
-                    # Add export button for single run report
-                    st.download_button(
-                        "📥 Export Run Report",
-                        utils.generate_run_report_html(
-                            metadata_list[selected_run],
-                            numeric_df,
-                            list_df,
-                            other_df,
-                        ),
-                        file_name=f"mzqc_run_{selected_run+1}_report.html",
-                        mime="text/html",
-                    )
-
-                    # Display metadata fields
-                    run_data = metadata_list[selected_run]
-                    st.write(f"**Label**: {run_data['label']}")
-                    st.write(f"**Input File**: {run_data['input_file']}")
-                    st.write(f"**Software**: {run_data['software']}")
-
-                    # Display numeric metrics
-                    if not numeric_df.empty:
-                        st.subheader("📊 Numeric Metrics")
-                        st.dataframe(
-                            numeric_df,
-                            column_config={
-                                "value": st.column_config.NumberColumn(
-                                    "value",
-                                    help="Metric value",
-                                )
-                            },
-                        )
-
-                        # Visualize numeric metrics
-                        st.subheader("📈 Metrics Visualization")
-                        for _, row in numeric_df.iterrows():
-                            metric_name = row["name"]
-                            value = row["value"]
-
-                            st.write(f"**{metric_name}**")
-
-                            metric_df = pd.DataFrame(
-                                {
-                                    "Metric": [metric_name],
-                                    "Value": [value],
-                                }
-                            )
-
-                            x_domain = [0, value * 1.1]
-
-                            base = (
-                                alt.Chart(metric_df)
-                                .encode(
-                                    y=alt.Y(
-                                        "Metric:N",
-                                        title=None,
-                                        axis=alt.Axis(
-                                            labelColor="white",
-                                            labelFontSize=12,
-                                            labelLimit=200,
-                                        ),
-                                    ),
-                                    x=alt.X(
-                                        "Value:Q",
-                                        title="Value",
-                                        scale=alt.Scale(domain=x_domain),
-                                        axis=alt.Axis(
-                                            labelColor="white",
-                                            gridColor="#333",
-                                            tickColor="white",
-                                        ),
-                                    ),
-                                    tooltip=["Metric", "Value"],
-                                )
-                                .properties(height=30, width=600)
-                            )
-
-                            bar = base.mark_bar(color="#7FB3D5", height=8)
-
-                            text = base.mark_text(
-                                align="left",
-                                baseline="middle",
-                                dx=5,
-                                color="white",
-                                fontSize=12,
-                            ).encode(text=alt.Text("Value:Q", format=".2f"))
-
-                            final_chart = (
-                                alt.layer(bar, text)
-                                .configure_view(strokeWidth=0)
-                                .configure(background="#1E1E1E")
-                            )
-
-                            show(final_chart)
-
-                    # Display list metrics
-                    if not list_df.empty:
-                        col1, col2 = st.columns([0.85, 0.15])
-                        with col1:
-                            st.subheader("📋 List Metrics")
-                        with col2:
-                            st.download_button(
-                                "⬇ Download CSV",
-                                data=list_df.to_csv(index=False),
-                                file_name="list_metrics.csv",
-                                mime="text/csv",
-                                key="list_download",
-                            )
-
-                        for _, row in list_df.iterrows():
-                            with st.expander(f"{row['name']}"):
-                                st.write("Values:")
-                                st.json(row["value"])
-
-                    # Display other metrics
-                    if not other_df.empty:
-                        col1, col2 = st.columns([0.85, 0.15])
-                        with col1:
-                            st.subheader("📑 Other Metrics")
-                        with col2:
-                            st.download_button(
-                                "⬇ Download CSV",
-                                data=other_df.to_csv(index=False),
-                                file_name="other_metrics.csv",
-                                mime="text/csv",
-                                key="other_download",
-                            )
-
-                        for _, row in other_df.iterrows():
-                            with st.expander(f"{row['name']}"):
-                                st.write("Value:")
-                                st.code(str(row["value"]))
+                    render_run_view(metadata_list, metric_dfs, digest)
 
         else:
-            st.error(validation_msg)
+            st.error("❌ The file could not be parsed as mzQC.")
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
 import pandas as pd
 from typing import Tuple, Optional
-from mzqc.MZQCFile import JsonSerialisable
 
 
 def load_mzqc_from_json_string(json_str: str):
+    # Imported here so that importing this module stays cheap.
+    from mzqc.MZQCFile import JsonSerialisable
+
     try:
         return JsonSerialisable.FromJson(json_str)
     except Exception as e:
@@ -0,0 +1,89 @@
+import streamlit as st
+import pandas as pd
+import altair as alt
+import json
+from typing import Any, Dict, List, Union
+
+from src import utils
+
+
+def render_single_value(value: Union[int, float, str], metric_name: str) -> None:
+    """Render a single scalar value metric."""
+    st.markdown(f"### 📊 {metric_name}")
+
+    if isinstance(value, pd.DataFrame):
+        value = value.iloc[0, 0]
+
+    if isinstance(value, (int, float, str)):
+        st.metric(label=metric_name, value=value)
+        chart_data = pd.DataFrame({metric_name: [value]})
+        st.bar_chart(chart_data)
+    else:
+        msg = f"⚠ Invalid metric type for `{metric_name}`: {type(value)}"
+        st.warning(msg)
+
+
+def visualize_metric(value: Any, name: str) -> None:
+    """Visualize a metric with appropriate chart type."""
+    st.markdown(f"### 🧪 {name}")
+    if isinstance(value, (int, float)):
+        _render_scalar(value, name)
+    elif isinstance(value, list):
+        _render_list(value, name)
+    elif isinstance(value, dict):
+        _render_dict(value, name)
+    elif isinstance(value, str):
+        _render_string(value, name)
+    else:
+        _render_unknown(value, name)
+
+
+def _render_scalar(val: Union[int, float], name: str) -> None:
+    st.metric(label=name, value=val)
+    st.bar_chart(pd.DataFrame({name: [val]}))
+
+
+def _render_list(lst: List[Any], name: str) -> None:
+    is_numeric = all(utils.is_number(x) for x in lst)
+    if is_numeric:
+        indices = list(range(1, len(lst) + 1))
+        df = pd.DataFrame({"index": indices, "value": lst})
+        base = alt.Chart(df).mark_line(point=True)
+        chart = base.encode(
+            x="index:O", y="value:Q", tooltip=["index", "value"]
+        ).properties(title=name)
+        st.altair_chart(chart, use_container_width=True)
+    else:
+        st.json(lst)
+
+
+def _render_dict(dct: Dict[Any, Any], name: str) -> None:
+    try:
+        df = pd.DataFrame.from_dict(dct, orient="index").T
+        st.dataframe(df)
+    except Exception:
+        st.json(dct)
+
+
+def _render_string(text: str, name: str) -> None:
+    if len(text) > 100:
+        try:
+            st.json(json.loads(text))
+        except Exception:
+            st.code(text)
+    else:
+        st.code(text)
+
+
+def _render_unknown(val: Any, name: str) -> None:
+    st.warning(f"⚠ Unknown format for `{name}`")
+    st.write(val)
+
+
+def render_table_metric(value: pd.DataFrame, name: str) -> None:
+    """Render a metric when it has a tabular (dataframe) structure."""
+    if isinstance(value, pd.DataFrame):
+        st.subheader(f"📊 {name} as Table")
+        st.dataframe(value)
+    else:
+        st.warning(f"⚠ Metric `{name}` has unsupported format.")
@@ -0,0 +1,204 @@
+import json
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+MAX_POINTS = 500
+SIGNIFICANT_DIGITS = 4
+
+
+def _compact_number(x: Any) -> Optional[float]:
+    """Round a number to a few significant digits for compact JSON."""
+    if x is None or isinstance(x, bool) or not isinstance(x, (int, float)):
+        return None
+    if isinstance(x, float) and not math.isfinite(x):
+        return None
+    value = float(f"{x:.{SIGNIFICANT_DIGITS}g}")
+    return int(value) if value.is_integer() else value
+
+
+def downsample(
+    values: Sequence[float], max_points: int = MAX_POINTS
+) -> Tuple[Optional[List[int]], List[float]]:
+    """Reduce a numeric series to at most ``max_points`` points.
+
+    Each bucket keeps its minimum and maximum so that peaks survive. Returns
+    the kept indices (``None`` when nothing was dropped) and their values.
+    """
+    n = len(values)
+    if n <= max_points:
+        return None, list(values)
+    buckets = max(1, max_points // 2)
+    size = n / buckets
+    indices: List[int] = []
+    for b in range(buckets):
+        start, end = int(b * size), int((b + 1) * size)
+        bucket = range(start, max(end, start + 1))
+        lo = min(bucket, key=lambda i: values[i])
+        hi = max(bucket, key=lambda i: values[i])
+        indices.extend(sorted({lo, hi}))
+    return indices, [values[i] for i in indices]
+
+
+class ReportDataset:
+    """Deduplicated data shared by every chart of one HTML report.
+
+    Charts only store references into this dataset, so identical series
+    (e.g. the same run labels) are embedded once and the report grows with
+    the amount of data, not with the number of charts.
+    """
+
+    def __init__(self, max_points: int = MAX_POINTS):
+        self.max_points = max_points
+        self._series: List[List[Any]] = []
+        self._ids: Dict[str, int] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._series)
+
+    def add(self, values: Sequence[Any]) -> int:
+        """Store a series once and return its reference."""
+        key = json.dumps(values, separators=(",", ":"))
+        if key not in self._ids:
+            self._ids[key] = len(self._series)
+            self._series.append(list(values))
+        return self._ids[key]
+
+    def bar_chart(self, labels: Sequence[str], values: Sequence[Any]) -> str:
+        """Return a placeholder for a horizontal bar chart."""
+        spec = {
+            "t": "bar",
+            "l": self.add([str(label) for label in labels]),
+            "v": self.add([_compact_number(v) for v in values]),
+        }
+        return _chart_div(spec)
+
+    def line_chart(self, values: Sequence[float]) -> str:
+        """Return a placeholder for a line chart of a (downsampled) numeric list."""
+        indices, kept = downsample(values, self.max_points)
+        spec = {"t": "line", "v": self.add([_compact_number(v) for v in kept])}
+        if indices is not None:
+            spec["x"] = self.add(indices)
+            spec["n"] = len(values)
+        return _chart_div(spec)
+
+    def box_chart(
+        self,
+        labels: Sequence[str],
+        mins: Sequence[Any],
+        q1s: Sequence[Any],
+        medians: Sequence[Any],
+        q3s: Sequence[Any],
+        maxs: Sequence[Any],
+    ) -> str:
+        """Return a placeholder for a box plot built from summary statistics."""
+        spec = {
+            "t": "box",
+            "l": self.add([str(label) for label in labels]),
+            "s": [
+                self.add([_compact_number(v) for v in series])
+                for series in (mins, q1s, medians, q3s, maxs)
+            ],
+        }
+        return _chart_div(spec)
+
+    def to_json(self) -> str:
+        data = json.dumps(self._series, separators=(",", ":"))
+        # Keep the payload from closing the surrounding <script> element.
+        return data.replace("</", "<\\/")
+
+    def render_script(self) -> str:
+        """Return the inline data and renderer; empty if no chart was added."""
+        if not self:
+            return ""
+        return (
+            '<script type="application/json" id="mzqc-report-data">'
+            f"{self.to_json()}</script>\n<script>{_RENDERER_JS}</script>"
+        )
+
+
+def _chart_div(spec: Dict[str, Any]) -> str:
+    return f"<div class=\"chart\" data-chart='{json.dumps(spec)}'></div>"
+
+
+CHART_CSS = """
+            .chart svg {
+                display: block;
+                margin: 10px 0;
+                font: 11px Arial, sans-serif;
+            }
+"""
+
+# Minimal SVG renderer so reports stay self-contained and work offline.
+_RENDERER_JS = """
+(function () {
+  var D = JSON.parse(document.getElementById("mzqc-report-data").textContent);
+  var NS = "http://www.w3.org/2000/svg";
+  function el(tag, attrs, text) {
+    var e = document.createElementNS(NS, tag);
+    for (var k in attrs) e.setAttribute(k, attrs[k]);
+    if (text !== undefined) e.textContent = text;
+    return e;
+  }
+  function fmt(v) { return v === null ? "-" : String(+(+v).toPrecision(4)); }
+  function bar(svg, c) {
+    var labels = D[c.l], values = D[c.v], W = 600, L = 200, H = 22;
+    var max = Math.max.apply(null, values.map(function (v) { return Math.abs(v || 0); })) || 1;
+    svg.setAttribute("width", W); svg.setAttribute("height", labels.length * H + 4);
+    labels.forEach(function (label, i) {
+      var v = values[i] || 0, w = Math.abs(v) / max * (W - L - 70), y = i * H + 2;
+      svg.appendChild(el("text", {x: L - 6, y: y + 14, "text-anchor": "end"}, label));
+      var r = el("rect", {x: L, y: y + 3, width: w, height: H - 8, fill: "#7FB3D5"});
+      r.appendChild(el("title", {}, label + ": " + fmt(values[i])));
+      svg.appendChild(r);
+      svg.appendChild(el("text", {x: L + w + 5, y: y + 14}, fmt(values[i])));
+    });
+  }
+  function line(svg, c) {
+    var ys = D[c.v], xs = c.x !== undefined ? D[c.x] : ys.map(function (_, i) { return i; });
+    var W = 600, H = 160, P = 40, n = c.n || ys.length;
+    var finite = ys.filter(function (v) { return v !== null; });
+    if (!finite.length) return;
+    var lo = Math.min.apply(null, finite), hi = Math.max.apply(null, finite), span = (hi - lo) || 1;
+    var pts = [];
+    ys.forEach(function (v, i) {
+      if (v === null) return;
+      pts.push((P + xs[i] / Math.max(n - 1, 1) * (W - P - 10)).toFixed(1) + "," +
+               (H - 20 - (v - lo) / span * (H - 30)).toFixed(1));
+    });
+    svg.setAttribute("width", W); svg.setAttribute("height", H);
+    svg.appendChild(el("polyline", {points: pts.join(" "), fill: "none", stroke: "#2E86C1"}));
+    svg.appendChild(el("text", {x: P - 4, y: 14, "text-anchor": "end"}, fmt(hi)));
+    svg.appendChild(el("text", {x: P - 4, y: H - 20, "text-anchor": "end"}, fmt(lo)));
+    svg.appendChild(el("text", {x: W - 10, y: H - 4, "text-anchor": "end"},
+                       n + " values" + (c.x !== undefined ? " (downsampled)" : "")));
+  }
+  function box(svg, c) {
+    var labels = D[c.l], s = c.s.map(function (id) { return D[id]; });
+    var W = 600, L = 200, H = 26;
+    var lo = Math.min.apply(null, s[0]), hi = Math.max.apply(null, s[4]), span = (hi - lo) || 1;
+    function x(v) { return L + (v - lo) / span * (W - L - 20); }
+    svg.setAttribute("width", W); svg.setAttribute("height", labels.length * H + 20);
+    labels.forEach(function (label, i) {
+      var y = i * H + 2, mid = y + H / 2;
+      svg.appendChild(el("text", {x: L - 6, y: mid + 4, "text-anchor": "end"}, label));
+      svg.appendChild(el("line", {x1: x(s[0][i]), x2: x(s[4][i]), y1: mid, y2: mid, stroke: "#555"}));
+      var r = el("rect", {x: x(s[1][i]), y: y + 5, width: Math.max(x(s[3][i]) - x(s[1][i]), 1),
+                          height: H - 10, fill: "#7FB3D5"});
+      r.appendChild(el("title", {}, label + ": min " + fmt(s[0][i]) + ", q1 " + fmt(s[1][i]) +
+                       ", median " + fmt(s[2][i]) + ", q3 " + fmt(s[3][i]) + ", max " + fmt(s[4][i])));
+      svg.appendChild(r);
+      svg.appendChild(el("line", {x1: x(s[2][i]), x2: x(s[2][i]), y1: y + 5, y2: y + H - 5,
+                                  stroke: "#1B4F72", "stroke-width": 2}));
+    });
+    var base = labels.length * H + 16;
+    svg.appendChild(el("text", {x: L, y: base}, fmt(lo)));
+    svg.appendChild(el("text", {x: W - 20, y: base, "text-anchor": "end"}, fmt(hi)));
+  }
+  var R = {bar: bar, line: line, box: box};
+  document.querySelectorAll("div.chart[data-chart]").forEach(function (div) {
+    var c = JSON.parse(div.getAttribute("data-chart")), svg = el("svg", {});
+    R[c.t](svg, c);
+    div.appendChild(svg);
+  });
+})();
+"""
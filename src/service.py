@@ -0,0 +1,236 @@
+import argparse
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+
+from src import parser, validator
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8600
+DEFAULT_QUEUE_SIZE = 32
+DEFAULT_CACHE_SIZE = 128
+MAX_BODY_BYTES = 50 * 1024 * 1024
+JOB_TIMEOUT = 120
+
+
+def validate_job(json_str: str) -> dict:
+    """Run schema validation and return a JSON-serialisable result.
+
+    A schema download failure is raised rather than reported as an invalid
+    body, so that the result is not cached and the request can be retried.
+    """
+    validator.load_schema_from_web()
+    is_valid, message = validator.validate_mzqc(json_str)
+    return {"valid": is_valid, "message": message}
+
+
+def parse_job(json_str: str) -> dict:
+    """Parse an mzQC document and return its runs as JSON-serialisable data."""
+    metadata_list, metric_dfs, file_metadata = parser.parse_mzqc(json_str)
+    if metadata_list is None:
+        return {"error": "Could not parse the mzQC file."}
+    runs = []
+    for meta, df in zip(metadata_list, metric_dfs):
+        # to_json takes care of NaN and NumPy scalars inside the values.
+        metrics = json.loads(df.to_json(orient="records")) if not df.empty else []
+        runs.append({"metadata": meta, "metrics": metrics})
+    return {"file_metadata": file_metadata, "runs": runs}
+
+
+JOBS: Dict[str, Callable[[str], dict]] = {
+    "/validate": validate_job,
+    "/parse": parse_job,
+}
+
+
+def run_job(path: str, json_str: str) -> Tuple[int, bytes]:
+    """Run a job in a worker and return the HTTP status and encoded body.
+
+    Encoding in the worker keeps serialisation off the server threads and
+    lets cache hits be answered without re-encoding.
+    """
+    result = JOBS[path](json_str)
+    return (422 if "error" in result else 200), json.dumps(result).encode("utf-8")
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class MzqcService:
+    """Runs validation and parsing jobs on a bounded process pool.
+
+    At most ``workers + queue_size`` jobs are accepted at a time; further
+    requests are rejected instead of piling up. Results are cached by the
+    SHA-256 of the request body, and identical requests that arrive while a
+    job is still running share its future.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_size = cache_size
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._slots = threading.BoundedSemaphore(self.workers + queue_size)
+        self._cache: "OrderedDict[Tuple[str, str], Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "cache_hits": 0, "rejected": 0}
+
+    def _release(self, key: Tuple[str, str], future: Future) -> None:
+        self._slots.release()
+        if future.cancelled() or future.exception() is not None:
+            with self._lock:
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+
+    def submit(self, path: str, body: bytes) -> Future:
+        """Return a future resolving to the ``(status, body)`` of a job."""
+        key = (path, hashlib.sha256(body).hexdigest())
+        with self._lock:
+            self.stats["requests"] += 1
+            future = self._cache.get(key)
+            # A failed job may still be cached until its callback evicts it.
+            if future is not None and not (future.done() and future.exception()):
+                self._cache.move_to_end(key)
+                self.stats["cache_hits"] += 1
+                return future
+            if not self._slots.acquire(blocking=False):
+                self.stats["rejected"] += 1
+                raise QueueFullError()
+            try:
+                future = self._submit_job(path, body)
+            except Exception:
+                self._slots.release()
+                raise
+            self._cache[key] = future
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        future.add_done_callback(lambda f: self._release(key, f))
+        return future
+
+    def _submit_job(self, path: str, body: bytes) -> Future:
+        try:
+            return self._pool.submit(run_job, path, body.decode("utf-8"))
+        except BrokenProcessPool:
+            # A worker died, e.g. out of memory on a large body; the pool
+            # rejects all further jobs, so replace it.
+            self._pool.shutdown(wait=False)
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool.submit(run_job, path, body.decode("utf-8"))
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(cancel_futures=True)
+
+
+def make_handler(service: MzqcService, max_body_bytes: int = MAX_BODY_BYTES):
+    """Build a request handler class bound to ``service``."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, payload: dict) -> None:
+            self._send_body(status, json.dumps(payload).encode("utf-8"))
+
+        def _send_body(self, status: int, body: bytes) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if status == 503:
+                self.send_header("Retry-After", "1")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._send(200, {"status": "ok", "workers": service.workers})
+            elif self.path == "/stats":
+                self._send(200, dict(service.stats))
+            else:
+                self._send(404, {"error": f"Unknown endpoint {self.path}"})
+
+        def do_POST(self):
+            if self.path not in JOBS:
+                self._send(404, {"error": f"Unknown endpoint {self.path}"})
+                return
+            header = self.headers.get("Content-Length")
+            if header is None:
+                self._send(411, {"error": "Content-Length header is required."})
+                return
+            try:
+                length = int(header)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self.close_connection = True
+                self._send(400, {"error": "Content-Length must be an integer >= 0."})
+                return
+            if length > max_body_bytes:
+                self.close_connection = True
+                self._send(413, {"error": f"Body exceeds {max_body_bytes} bytes."})
+                return
+            body = self.rfile.read(length)
+            try:
+                body.decode("utf-8")
+            except UnicodeDecodeError:
+                self._send(400, {"error": "Body must be UTF-8 encoded JSON."})
+                return
+
+            try:
+                future = service.submit(self.path, body)
+                status, result = future.result(timeout=JOB_TIMEOUT)
+            except QueueFullError:
+                self._send(503, {"error": "Server busy, try again later."})
+            except FutureTimeoutError:
+                self._send(504, {"error": "Processing timed out."})
+            except validator.SchemaUnavailableError as e:
+                self._send(503, {"error": str(e)})
+            except Exception as e:
+                self._send(500, {"error": f"Processing failed: {e}"})
+            else:
+                self._send_body(status, result)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(
+        description="Serve mzQC validation and parsing as a JSON HTTP API."
+    )
+    arg_parser.add_argument("--host", default=DEFAULT_HOST)
+    arg_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    arg_parser.add_argument("--workers", type=int, default=None)
+    arg_parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE)
+    arg_parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE)
+    arg_parser.add_argument("--max-body-bytes", type=int, default=MAX_BODY_BYTES)
+    args = arg_parser.parse_args(argv)
+
+    service = MzqcService(args.workers, args.queue_size, args.cache_size)
+    handler = make_handler(service, args.max_body_bytes)
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(
+        f"mzQC service on http://{args.host}:{args.port} "
+        f"({service.workers} workers)"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
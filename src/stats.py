@@ -0,0 +1,116 @@
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src import utils
+
+HIST_BINS = 20
+STAT_COLUMNS = ["length", "min", "q1", "median", "q3", "max", "mean"]
+
+
+def _as_numeric_array(value) -> Optional[np.ndarray]:
+    """Return the finite values of a flat numeric list, or None."""
+    if not isinstance(value, list) or not value:
+        return None
+    if not all(utils.is_number(x) for x in value):
+        return None
+    arr = np.asarray(value, dtype=float)
+    arr = arr[np.isfinite(arr)]
+    return arr if arr.size else None
+
+
+def summarize_list_metrics(
+    metric_dfs: List[pd.DataFrame],
+    metadata_list: List[Dict[str, str]],
+    selected_runs: Optional[Sequence[int]] = None,
+    bins: int = HIST_BINS,
+) -> Optional[pd.DataFrame]:
+    """Summarise every numeric list metric of the selected runs.
+
+    All lists are concatenated into one array and reduced per (run, metric)
+    segment in a single vectorised pass: min, max, mean, quartiles, length
+    and a histogram whose bin edges are shared by all runs of a metric.
+    ``length`` is the length of the list; the statistics ignore NaN and
+    infinite values. Returns one row per run and metric, or None if there
+    are no list metrics.
+    """
+    runs, names, arrays, raw_lengths = [], [], [], []
+    for i, (df, meta) in enumerate(zip(metric_dfs, metadata_list)):
+        if selected_runs is not None and i not in selected_runs:
+            continue
+        if df is None or df.empty:
+            continue
+        for name, value in zip(df["name"], df["value"]):
+            arr = _as_numeric_array(value)
+            if arr is not None:
+                runs.append(f"Run {i+1}: {meta['label']}")
+                names.append(name)
+                arrays.append(arr)
+                raw_lengths.append(len(value))
+    if not arrays:
+        return None
+
+    lengths = np.array([a.size for a in arrays])
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    values = np.concatenate(arrays)
+    segment = np.repeat(np.arange(len(arrays)), lengths)
+
+    # Sorting by (segment, value) gives order statistics for every segment.
+    sorted_values = values[np.lexsort((values, segment))]
+    last = offsets + lengths - 1
+    stats = {
+        "length": np.array(raw_lengths),
+        "min": sorted_values[offsets],
+        "max": sorted_values[last],
+        "mean": np.add.reduceat(values, offsets) / lengths,
+    }
+    for column, q in (("q1", 0.25), ("median", 0.5), ("q3", 0.75)):
+        pos = offsets + q * (lengths - 1)
+        lo = np.floor(pos).astype(int)
+        hi = np.ceil(pos).astype(int)
+        below, above = sorted_values[lo], sorted_values[hi]
+        stats[column] = below + (above - below) * (pos - lo)
+
+    # Histogram bins span the range of a metric across all selected runs.
+    metric_names, metric_idx = np.unique(
+        np.array(names, dtype=object), return_inverse=True
+    )
+    metric_lo = np.full(len(metric_names), np.inf)
+    metric_hi = np.full(len(metric_names), -np.inf)
+    np.minimum.at(metric_lo, metric_idx, stats["min"])
+    np.maximum.at(metric_hi, metric_idx, stats["max"])
+    width = (metric_hi - metric_lo) / bins
+    width[width == 0] = 1.0
+
+    value_metric = metric_idx[segment]
+    bin_idx = np.floor((values - metric_lo[value_metric]) / width[value_metric])
+    bin_idx = np.clip(bin_idx.astype(int), 0, bins - 1)
+    counts = np.bincount(segment * bins + bin_idx, minlength=len(arrays) * bins)
+    counts = counts.reshape(len(arrays), bins)
+
+    summary = pd.DataFrame({"run": runs, "name": names})
+    for column in STAT_COLUMNS:
+        summary[column] = stats[column]
+    summary["hist_counts"] = [row.tolist() for row in counts]
+    summary["hist_start"] = metric_lo[metric_idx]
+    summary["hist_width"] = width[metric_idx]
+    return summary
+
+
+def histogram_df(summary: pd.DataFrame) -> pd.DataFrame:
+    """Expand precomputed histograms into one row per run and bin."""
+    rows = []
+    for _, row in summary.iterrows():
+        for b, count in enumerate(row["hist_counts"]):
+            start = row["hist_start"] + b * row["hist_width"]
+            rows.append(
+                {
+                    "run": row["run"],
+                    "name": row["name"],
+                    "bin_start": start,
+                    "bin_end": start + row["hist_width"],
+                    "count": count,
+                }
+            )
+    return pd.DataFrame(rows)
@@ -1,10 +1,24 @@
-import streamlit as st
 import pandas as pd
-import altair as alt
 import json
 from datetime import datetime
 from typing import Dict, List, Union, Optional, Any
 
+from src.report_charts import CHART_CSS, ReportDataset
+
+LIST_PREVIEW = 10
+
+# Streamlit render helpers that moved to src.render; still importable from here.
+_RENDER_HELPERS = {"render_single_value", "visualize_metric", "render_table_metric"}
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so that importing utils does not load Streamlit.
+    if name in _RENDER_HELPERS:
+        from src import render
+
+        return getattr(render, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def clean_metrics_df(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and cast metric values to appropriate types."""
@@ -22,6 +36,7 @@ def generate_run_report_html(
 ) -> str:
     """Generate HTML report for a single run."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    charts = ReportDataset()
 
     html = f"""
     <html>
@@ -75,6 +90,7 @@ def generate_run_report_html(
                 color: #333;
                 margin-bottom: 20px;
             }}
+            {CHART_CSS}
         </style>
     </head>
     <body>
@@ -125,7 +141,9 @@ def generate_run_report_html(
                     <td>{unit_acc}</td>
                 </tr>
             """
-        html += "</table></div>"
+        html += "</table>"
+        html += charts.bar_chart(numeric_df["name"], numeric_df["value"])
+        html += "</div>"
 
     if not list_df.empty:
         html += """
@@ -139,10 +157,15 @@ def generate_run_report_html(
         """
         for _, row in list_df.iterrows():
             values = json.dumps(row["value"], indent=2)
+            chart = ""
+            if row["value"] and all(is_number(x) for x in row["value"]):
+                chart = charts.line_chart(row["value"])
+                # The chart shows the series; the bulk export has every value.
+                values = _list_preview(row["value"])
             html += f"""
                 <tr>
                     <td>{row['name']}</td>
-                    <td><pre>{values}</pre></td>
+                    <td>{chart}<pre>{values}</pre></td>
                 </tr>
             """
         html += "</table></div>"
@@ -166,6 +189,7 @@ def generate_run_report_html(
             """
         html += "</table></div>"
 
+    html += charts.render_script()
     html += """
     </body>
     </html>
@@ -177,9 +201,15 @@ def generate_comparison_report_html(
     metadata_list: List[Dict[str, str]],
     comparison_df: pd.DataFrame,
     selected_metric: Optional[str] = None,
+    list_stats_df: Optional[pd.DataFrame] = None,
 ) -> str:
-    """Generate HTML report for run comparison."""
+    """Generate HTML report for run comparison.
+
+    ``list_stats_df`` holds precomputed summaries of list metrics (see
+    ``stats.summarize_list_metrics``); they are reported as distributions.
+    """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    charts = ReportDataset()
 
     html = f"""
     <html>
@@ -233,6 +263,7 @@ def generate_comparison_report_html(
             tr:hover {{
                 background-color: #f5f5f5;
             }}
+            {CHART_CSS}
         </style>
     </head>
     <body>
@@ -264,7 +295,14 @@ def generate_comparison_report_html(
 
     html += "</table></div>"
 
+    df_view = None
     if comparison_df is not None:
+        if selected_metric:
+            df_view = comparison_df[comparison_df["name"] == selected_metric]
+        else:
+            df_view = comparison_df
+
+    if df_view is not None and not df_view.empty:
         html += """
         <div class="section">
             <h2>Metrics Comparison</h2>
@@ -276,11 +314,6 @@ def generate_comparison_report_html(
                 </tr>
         """
 
-        if selected_metric:
-            df_view = comparison_df[comparison_df["name"] == selected_metric]
-        else:
-            df_view = comparison_df
-
         for _, row in df_view.iterrows():
             html += f"""
                 <tr>
@@ -289,8 +322,63 @@ def generate_comparison_report_html(
                     <td>{row['value']:.2f}</td>
                 </tr>
             """
-        html += "</table></div>"
+        html += "</table>"
+        for metric_name, metric_rows in df_view.groupby("name", sort=False):
+            html += f"<h3>{metric_name}</h3>"
+            html += charts.bar_chart(metric_rows["run"], metric_rows["value"])
+        html += "</div>"
 
+    if list_stats_df is not None:
+        if selected_metric:
+            stats_view = list_stats_df[list_stats_df["name"] == selected_metric]
+        else:
+            stats_view = list_stats_df
+
+        if not stats_view.empty:
+            html += """
+            <div class="section">
+                <h2>List Metrics Distribution</h2>
+                <table>
+                    <tr>
+                        <th>Run</th>
+                        <th>Metric</th>
+                        <th>Length</th>
+                        <th>Min</th>
+                        <th>Q1</th>
+                        <th>Median</th>
+                        <th>Q3</th>
+                        <th>Max</th>
+                        <th>Mean</th>
+                    </tr>
+            """
+            for _, row in stats_view.iterrows():
+                html += f"""
+                    <tr>
+                        <td>{row['run']}</td>
+                        <td>{row['name']}</td>
+                        <td>{row['length']}</td>
+                        <td>{row['min']:.2f}</td>
+                        <td>{row['q1']:.2f}</td>
+                        <td>{row['median']:.2f}</td>
+                        <td>{row['q3']:.2f}</td>
+                        <td>{row['max']:.2f}</td>
+                        <td>{row['mean']:.2f}</td>
+                    </tr>
+                """
+            html += "</table>"
+            for metric_name, metric_rows in stats_view.groupby("name", sort=False):
+                html += f"<h3>{metric_name}</h3>"
+                html += charts.box_chart(
+                    metric_rows["run"],
+                    metric_rows["min"],
+                    metric_rows["q1"],
+                    metric_rows["median"],
+                    metric_rows["q3"],
+                    metric_rows["max"],
+                )
+            html += "</div>"
+
+    html += charts.render_script()
     html += """
     </body>
     </html>
@@ -298,6 +386,19 @@ def generate_comparison_report_html(
     return html
 
 
+def _list_preview(values: List[Any], limit: int = LIST_PREVIEW) -> str:
+    """Show the first values of a list and how many there are in total."""
+    head = ", ".join(json.dumps(v) for v in values[:limit])
+    if len(values) <= limit:
+        return f"[{head}]"
+    return f"[{head}, …] ({len(values)} values)"
+
+
+def is_number(x: Any) -> bool:
+    """Whether ``x`` is a numeric value; booleans are not, NaN is."""
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
 def _smart_cast(val: Union[str, int, float]) -> Union[str, int, float]:
     """Cast string values to appropriate numeric types if possible."""
     try:
@@ -311,85 +412,3 @@ def _smart_cast(val: Union[str, int, float]) -> Union[str, int, float]:
         return val
     except Exception:
         return val
-
-
-def render_single_value(value: Union[int, float, str], metric_name: str) -> None:
-    """Render a single scalar value metric."""
-    st.markdown(f"### 📊 {metric_name}")
-
-    if isinstance(value, pd.DataFrame):
-        value = value.iloc[0, 0]
-
-    if isinstance(value, (int, float, str)):
-        st.metric(label=metric_name, value=value)
-        chart_data = pd.DataFrame({metric_name: [value]})
-        st.bar_chart(chart_data)
-    else:
-        msg = f"⚠ Invalid metric type for `{metric_name}`: {type(value)}"
-        st.warning(msg)
-
-
-def visualize_metric(value: Any, name: str) -> None:
-    """Visualize a metric with appropriate chart type."""
-    st.markdown(f"### 🧪 {name}")
-    if isinstance(value, (int, float)):
-        _render_scalar(value, name)
-    elif isinstance(value, list):
-        _render_list(value, name)
-    elif isinstance(value, dict):
-        _render_dict(value, name)
-    elif isinstance(value, str):
-        _render_string(value, name)
-    else:
-        _render_unknown(value, name)
-
-
-def _render_scalar(val: Union[int, float], name: str) -> None:
-    st.metric(label=name, value=val)
-    st.bar_chart(pd.DataFrame({name: [val]}))
-
-
-def _render_list(lst: List[Any], name: str) -> None:
-    is_numeric = all(isinstance(x, (int, float)) for x in lst)
-    if is_numeric:
-        indices = list(range(1, len(lst) + 1))
-        df = pd.DataFrame({"index": indices, "value": lst})
-        base = alt.Chart(df).mark_line(point=True)
-        chart = base.encode(
-            x="index:O", y="value:Q", tooltip=["index", "value"]
-        ).properties(title=name)
-        st.altair_chart(chart, use_container_width=True)
-    else:
-        st.json(lst)
-
-
-def _render_dict(dct: Dict[Any, Any], name: str) -> None:
-    try:
-        df = pd.DataFrame.from_dict(dct, orient="index").T
-        st.dataframe(df)
-    except Exception:
-        st.json(dct)
-
-
-def _render_string(text: str, name: str) -> None:
-    if len(text) > 100:
-        try:
-            st.json(json.loads(text))
-        except Exception:
-            st.code(text)
-    else:
-        st.code(text)
-
-
-def _render_unknown(val: Any, name: str) -> None:
-    st.warning(f"⚠ Unknown format for `{name}`")
-    st.write(val)
-
-
-def render_table_metric(value: pd.DataFrame, name: str) -> None:
-    """Render a metric when it has a tabular (dataframe) structure."""
-    if isinstance(value, pd.DataFrame):
-        st.subheader(f"📊 {name} as Table")
-        st.dataframe(value)
-    else:
-        st.warning(f"⚠ Metric `{name}` has unsupported format.")
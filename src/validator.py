@@ -1,19 +1,43 @@
+import hashlib
 import json
-import requests
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 from jsonschema import validate, ValidationError
 
 SCHEMA_URL = (
     "https://raw.githubusercontent.com/HUPO-PSI/mzQC/main/schema/mzqc_schema.json"
 )
 
+VALIDATION_TIMEOUT = 120
+SCHEMA_REQUEST_TIMEOUT = 30
+VALIDATION_WORKERS = 2
+VALIDATION_CACHE_SIZE = 32
+# Jobs queued or running at once; further submissions are refused as busy.
+VALIDATION_MAX_PENDING = 4 * VALIDATION_WORKERS
 
+
+class SchemaUnavailableError(RuntimeError):
+    """The schema could not be downloaded; a later attempt may succeed."""
+
+
+class ValidationBusyError(RuntimeError):
+    """Too many validation jobs are pending; a later attempt may succeed."""
+
+
+@lru_cache(maxsize=1)
 def load_schema_from_web() -> dict:
+    import requests
+
     try:
-        response = requests.get(SCHEMA_URL)
+        response = requests.get(SCHEMA_URL, timeout=SCHEMA_REQUEST_TIMEOUT)
         response.raise_for_status()
         return response.json()
     except Exception as e:
-        raise RuntimeError(f"Failed to load schema: {e}")
+        raise SchemaUnavailableError(f"Failed to load schema: {e}")
 
 
 def validate_mzqc(json_str: str) -> tuple[bool, str]:
@@ -26,3 +50,138 @@ def validate_mzqc(json_str: str) -> tuple[bool, str]:
         return False, f"❌ Validation failed: {ve.message}"
     except Exception as e:
         return False, f"❌ Error during validation: {e}"
+
+
+def validate_semantics(json_str: str) -> Dict[str, List[str]]:
+    """Run the mzqc library's semantic checks (CV terms, cross-references).
+
+    Returns the findings grouped by category; empty categories are dropped.
+    """
+    from mzqc.MZQCFile import JsonSerialisable
+    from mzqc.SemanticCheck import SemanticCheck
+
+    mzqc_obj = JsonSerialisable.FromJson(json_str)
+    check = SemanticCheck(mzqc_obj=mzqc_obj, file_path="")
+    check.validate()
+    findings = check.string_export()
+    return {category: list(issues) for category, issues in findings.items() if issues}
+
+
+def validate_full(json_str: str) -> dict:
+    """Run schema and semantic validation and collect all findings.
+
+    ``schema_checked`` is False when the schema could not be downloaded; such
+    results are not reused for later submissions of the same file.
+    """
+    try:
+        load_schema_from_web()
+    except SchemaUnavailableError as e:
+        is_valid, message, schema_checked = False, f"❌ {e}", False
+    else:
+        is_valid, message = validate_mzqc(json_str)
+        schema_checked = True
+    try:
+        semantic = validate_semantics(json_str)
+    except Exception as e:
+        semantic = {"errors": [f"Semantic validation could not run: {e}"]}
+    return {
+        "schema_valid": is_valid,
+        "schema_message": message,
+        "schema_checked": schema_checked,
+        "semantic": semantic,
+    }
+
+
+def file_hash(json_str: str) -> str:
+    return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_jobs: "OrderedDict[str, Tuple[Future, float]]" = OrderedDict()
+_jobs_lock = threading.Lock()
+_pending: Set[Future] = set()
+cache_stats = {"hits": 0, "misses": 0}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # Threads rather than processes: Streamlit replaces ``__main__`` with the
+    # app script, which spawned worker processes would execute again.
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            VALIDATION_WORKERS, thread_name_prefix="mzqc-validation"
+        )
+    return _executor
+
+
+def _is_reusable(job: Tuple[Future, float]) -> bool:
+    """Whether a cached job may answer a new submission of the same file.
+
+    Running jobs are always reused, also after a timeout, so that a hung
+    check is never started twice for the same file.
+    """
+    future, _ = job
+    if not future.done():
+        return True
+    return future.exception() is None and future.result()["schema_checked"]
+
+
+def _finish(future: Future) -> None:
+    with _jobs_lock:
+        _pending.discard(future)
+
+
+def submit_validation(json_str: str) -> str:
+    """Start full validation in a background worker, once per file content.
+
+    Returns the file hash that identifies the job for ``poll_validation``.
+    Raises ``ValidationBusyError`` when ``VALIDATION_MAX_PENDING`` jobs are
+    already queued or running.
+    """
+    key = file_hash(json_str)
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is not None and _is_reusable(job):
+            _jobs.move_to_end(key)
+            cache_stats["hits"] += 1
+            return key
+        if len(_pending) >= VALIDATION_MAX_PENDING:
+            raise ValidationBusyError(
+                "The validation workers are busy, please try again later."
+            )
+        cache_stats["misses"] += 1
+        future = _get_executor().submit(validate_full, json_str)
+        _pending.add(future)
+        _jobs[key] = (future, time.monotonic())
+        # Evict the oldest finished jobs; running ones stay registered.
+        finished = [k for k, (f, _) in _jobs.items() if f.done()]
+        for old in finished[: max(0, len(_jobs) - VALIDATION_CACHE_SIZE)]:
+            del _jobs[old]
+    # Outside the lock: the callback takes it and may run right away.
+    future.add_done_callback(_finish)
+    return key
+
+
+def poll_validation(
+    key: str, timeout: float = VALIDATION_TIMEOUT
+) -> Tuple[str, Optional[dict]]:
+    """Return the state of a validation job and its result when finished.
+
+    The state is one of ``"pending"``, ``"done"``, ``"timeout"``, ``"failed"``
+    or ``"unknown"`` (no job for this key).
+    """
+    with _jobs_lock:
+        job = _jobs.get(key)
+    if job is None:
+        return "unknown", None
+    future, submitted_at = job
+    if future.done():
+        error = future.exception()
+        if error is not None:
+            return "failed", {"error": str(error)}
+        return "done", future.result()
+    if time.monotonic() - submitted_at > timeout:
+        # The job keeps running and stays registered, so resubmitting the
+        # file does not start it again; its result is used once it finishes.
+        return "timeout", None
+    return "pending", None
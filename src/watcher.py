@@ -0,0 +1,297 @@
+import glob
+import hashlib
+import itertools
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src import parser, validator
+
+WATCH_PATTERNS = ("*.mzQC", "*.mzqc")
+DEFAULT_POLL_SECONDS = 5.0
+DEFAULT_QUEUE_SIZE = 16
+MAX_WATCHERS = 4
+# A watcher not looked up for this long may be stopped to watch another folder.
+WATCHER_IDLE_SECONDS = 60.0
+WATCH_ROOTS_ENV = "MZQC_WATCH_ROOTS"
+
+# Versions are unique across indexes, so a restarted watcher never repeats one.
+_versions = itertools.count(1)
+
+
+class RunIndex:
+    """Thread-safe in-memory index of the runs ingested from watched files.
+
+    Runs are kept per source file in ingestion order, so a changed file
+    replaces only its own runs, in place, and earlier files are never parsed
+    again. ``version`` changes whenever the runs change.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files: "OrderedDict[str, dict]" = OrderedDict()
+        self.version = next(_versions)
+
+    def update_file(
+        self,
+        path: str,
+        digest: str,
+        metadata_list: List[dict],
+        metric_dfs: List[pd.DataFrame],
+        validation_msg: str,
+    ) -> None:
+        name = os.path.basename(path)
+        runs = [
+            ({**meta, "source_file": name}, df)
+            for meta, df in zip(metadata_list, metric_dfs)
+        ]
+        with self._lock:
+            # A file deleted while it was processed stays removed.
+            if not os.path.exists(path):
+                return
+            # Assigning to an existing key keeps the file's position.
+            self._files[path] = {
+                "hash": digest,
+                "runs": runs,
+                "status": validation_msg,
+            }
+            self.version = next(_versions)
+
+    def set_error(self, path: str, digest: Optional[str], message: str) -> None:
+        with self._lock:
+            if not os.path.exists(path):
+                return
+            self._files[path] = {"hash": digest, "runs": [], "status": message}
+            self.version = next(_versions)
+
+    def remove_file(self, path: str) -> None:
+        with self._lock:
+            if self._files.pop(path, None) is not None:
+                self.version = next(_versions)
+
+    def paths(self) -> List[str]:
+        with self._lock:
+            return list(self._files)
+
+    def file_hash(self, path: str) -> Optional[str]:
+        with self._lock:
+            entry = self._files.get(path)
+        return entry["hash"] if entry else None
+
+    def snapshot(self) -> Tuple[List[dict], List[pd.DataFrame], int]:
+        """Return all runs as ``(metadata_list, metric_dfs, version)``."""
+        with self._lock:
+            runs = [run for entry in self._files.values() for run in entry["runs"]]
+            version = self.version
+        return [meta for meta, _ in runs], [df for _, df in runs], version
+
+    def file_status(self) -> pd.DataFrame:
+        """Return one row per watched file with its run count and status."""
+        with self._lock:
+            rows = [
+                {
+                    "file": os.path.basename(path),
+                    "runs": len(entry["runs"]),
+                    "status": entry["status"],
+                }
+                for path, entry in self._files.items()
+            ]
+        return pd.DataFrame(rows, columns=["file", "runs", "status"])
+
+
+class FolderWatcher:
+    """Poll a directory and ingest new or changed mzQC files into a RunIndex.
+
+    Files are detected by modification time and size, and only re-parsed
+    when their content hash changed. Detected files go through a bounded
+    queue; during a burst, files that do not fit are left for the next scan
+    instead of being dropped.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        index: Optional[RunIndex] = None,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        self.directory = directory
+        self.index = index or RunIndex()
+        self.poll_seconds = poll_seconds
+        self._queue: "queue.Queue[str]" = queue.Queue(maxsize=queue_size)
+        self._seen: Dict[str, Tuple[float, int]] = {}
+        self._seen_lock = threading.Lock()
+        self.last_used = time.monotonic()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def _list_files(self) -> List[str]:
+        paths = set()
+        for pattern in WATCH_PATTERNS:
+            paths.update(glob.glob(os.path.join(self.directory, pattern)))
+        return sorted(paths, key=lambda p: (os.path.getmtime(p), p))
+
+    def scan(self) -> int:
+        """Queue new or modified files; return how many were queued."""
+        try:
+            paths = self._list_files()
+        except OSError:
+            return 0
+        with self._seen_lock:
+            for path in set(self._seen) - set(paths):
+                del self._seen[path]
+        for path in set(self.index.paths()) - set(paths):
+            self.index.remove_file(path)
+
+        queued = 0
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature = (stat.st_mtime, stat.st_size)
+            with self._seen_lock:
+                if self._seen.get(path) == signature:
+                    continue
+                try:
+                    self._queue.put_nowait(path)
+                except queue.Full:
+                    break
+                self._seen[path] = signature
+            queued += 1
+        return queued
+
+    def process(self, path: str) -> bool:
+        """Validate and parse one file; return whether the index changed."""
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+        except OSError:
+            return False
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == self.index.file_hash(path):
+            return False
+
+        json_str = data.decode("utf-8", errors="replace")
+        try:
+            validator.load_schema_from_web()
+        except validator.SchemaUnavailableError as e:
+            # Record no hash and forget the file, so the next scan retries it.
+            self.index.set_error(path, None, f"⏳ Will retry: {e}")
+            with self._seen_lock:
+                self._seen.pop(path, None)
+            return True
+        _, validation_msg = validator.validate_mzqc(json_str)
+        metadata_list, metric_dfs, _ = parser.parse_mzqc(json_str)
+        if metadata_list is None:
+            self.index.set_error(path, digest, "❌ Could not parse the file.")
+        else:
+            self.index.update_file(
+                path, digest, metadata_list, metric_dfs, validation_msg
+            )
+        return True
+
+    def _scan_loop(self) -> None:
+        while not self._stop.is_set():
+            self.scan()
+            self._stop.wait(self.poll_seconds)
+
+    def _work_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                path = self._queue.get(timeout=self.poll_seconds)
+            except queue.Empty:
+                continue
+            try:
+                self.process(path)
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> "FolderWatcher":
+        if not self._threads:
+            for target in (self._scan_loop, self._work_loop):
+                thread = threading.Thread(target=target, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        return self
+
+    def stop(self, wait: bool = True) -> None:
+        self._stop.set()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads = []
+
+
+class WatcherLimitError(RuntimeError):
+    """No further folder can be watched until a watcher becomes idle."""
+
+
+_watchers: "OrderedDict[str, FolderWatcher]" = OrderedDict()
+_watchers_lock = threading.Lock()
+
+
+def watch_roots() -> List[str]:
+    """Return the directories below which folders may be watched.
+
+    They are configured with the ``MZQC_WATCH_ROOTS`` environment variable
+    (separated by ``os.pathsep``); without it, no folder can be watched.
+    """
+    value = os.environ.get(WATCH_ROOTS_ENV, "")
+    return [os.path.realpath(root) for root in value.split(os.pathsep) if root]
+
+
+def resolve_watch_dir(directory: str) -> Optional[str]:
+    """Return the real path of ``directory`` if it is a folder in a watch root.
+
+    Relative paths are resolved against each root in turn.
+    """
+    for root in watch_roots():
+        path = os.path.realpath(os.path.join(root, directory))
+        if os.path.commonpath([path, root]) == root and os.path.isdir(path):
+            return path
+    return None
+
+
+def get_watcher(directory: str) -> Optional[FolderWatcher]:
+    """Return the running watcher of ``directory``, or None; never starts one."""
+    with _watchers_lock:
+        folder_watcher = _watchers.get(directory)
+        if folder_watcher is not None:
+            folder_watcher.last_used = time.monotonic()
+        return folder_watcher
+
+
+def start_watcher(directory: str) -> FolderWatcher:
+    """Return the watcher of ``directory``, starting it if needed.
+
+    Watchers are shared by all sessions. At most ``MAX_WATCHERS`` folders are
+    watched at a time: a watcher nobody looked up for ``WATCHER_IDLE_SECONDS``
+    is stopped to make room, otherwise ``WatcherLimitError`` is raised.
+    """
+    with _watchers_lock:
+        folder_watcher = _watchers.get(directory)
+        if folder_watcher is None:
+            if len(_watchers) >= MAX_WATCHERS:
+                now = time.monotonic()
+                idle = [
+                    path
+                    for path, w in _watchers.items()
+                    if now - w.last_used > WATCHER_IDLE_SECONDS
+                ]
+                if not idle:
+                    raise WatcherLimitError(
+                        f"Already watching {MAX_WATCHERS} folders; "
+                        "try again when one of them is no longer viewed."
+                    )
+                # Do not block this session on the old worker finishing a file.
+                _watchers.pop(idle[0]).stop(wait=False)
+            folder_watcher = FolderWatcher(directory).start()
+            _watchers[directory] = folder_watcher
+        folder_watcher.last_used = time.monotonic()
+        return folder_watcher
@@ -0,0 +1,82 @@
+import io
+import math
+
+import pandas as pd
+import pytest
+
+from src import exporter
+
+METADATA = [{"label": "run_a", "input_file": "a.mzML", "software": "sw v1"}]
+METRICS = [
+    pd.DataFrame(
+        {
+            "accession": ["MS:1", "MS:2", "MS:3", "MS:4", "MS:5", "MS:6", "MS:7"],
+            "name": [
+                "scalar",
+                "list",
+                "table",
+                "missing",
+                "empty list",
+                "empty",
+                "flag",
+            ],
+            "value": [
+                3.5,
+                [1, 2.5, float("nan")],
+                {"mz": [100.0, 200.0], "peptide": ["PEP", "TIDE"]},
+                float("nan"),
+                [],
+                {},
+                True,
+            ],
+            "unit_name": [None] * 7,
+            "unit_accession": [None] * 7,
+        }
+    )
+]
+
+EXPECTED = [
+    # name, column, element_index, value, value_text
+    ("scalar", None, None, 3.5, None),
+    ("list", None, 0, 1.0, None),
+    ("list", None, 1, 2.5, None),
+    ("list", None, 2, None, None),
+    ("table", "mz", 0, 100.0, None),
+    ("table", "mz", 1, 200.0, None),
+    ("table", "peptide", 0, None, "PEP"),
+    ("table", "peptide", 1, None, "TIDE"),
+    ("missing", None, None, None, None),
+    ("empty list", None, None, None, None),
+    ("empty", None, None, None, None),
+    ("flag", None, None, None, "true"),
+]
+
+
+def _read(fmt, data):
+    if fmt == "csv":
+        return pd.read_csv(io.BytesIO(data))
+    if fmt == "parquet":
+        return pd.read_parquet(io.BytesIO(data))
+    return pd.read_excel(io.BytesIO(data))
+
+
+def _missing(x):
+    return x is None or (isinstance(x, float) and math.isnan(x)) or x is pd.NA
+
+
+@pytest.mark.parametrize("fmt", list(exporter.EXPORT_FORMATS))
+def test_export_round_trip(fmt):
+    pytest.importorskip({"parquet": "pyarrow", "xlsx": "openpyxl"}.get(fmt, "pandas"))
+    data = exporter.export_runs_to_bytes(METADATA, METRICS, fmt=fmt)
+    df = _read(fmt, data)
+
+    assert list(df.columns) == exporter.EXPORT_COLUMNS
+    assert len(df) == len(EXPECTED)
+    assert set(df["run_label"]) == {"run_a"}
+    for row, expected in zip(df.itertuples(index=False), EXPECTED):
+        actual = (row.name, row.column, row.element_index, row.value, row.value_text)
+        for got, want in zip(actual, expected):
+            if want is None:
+                assert _missing(got), (actual, expected)
+            else:
+                assert got == want, (actual, expected)
@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import import_time  # noqa: E402
+
+
+@pytest.mark.parametrize("module", list(import_time.BUDGETS))
+def test_headless_modules_do_not_import_forbidden_packages(module):
+    # Wall-clock budgets depend on the machine; check them with
+    # benchmarks/import_time.py (and --scale) instead.
+    _, forbidden = import_time.BUDGETS[module]
+    _, packages = import_time.measure(module)
+    assert not packages & forbidden
@@ -0,0 +1,75 @@
+import http.client
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from src import service, validator
+
+
+@pytest.fixture
+def server():
+    svc = service.MzqcService(workers=1)
+    # Jobs run in threads so that they see the test's monkeypatches.
+    svc._pool.shutdown()
+    svc._pool = ThreadPoolExecutor(max_workers=1)
+    httpd = ThreadingHTTPServer(
+        ("127.0.0.1", 0), service.make_handler(svc, max_body_bytes=1024)
+    )
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield svc, httpd.server_address[1]
+    httpd.shutdown()
+    httpd.server_close()
+    svc.shutdown()
+
+
+def post(port, body=b"", headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    conn.putrequest("POST", "/validate")
+    for name, value in (headers or {}).items():
+        conn.putheader(name, value)
+    conn.endheaders()
+    if body:
+        conn.send(body)
+    response = conn.getresponse()
+    payload = json.loads(response.read())
+    conn.close()
+    return response.status, payload
+
+
+@pytest.mark.parametrize(
+    "headers, status",
+    [
+        ({}, 411),
+        ({"Content-Length": "abc"}, 400),
+        ({"Content-Length": "-1"}, 400),
+        ({"Content-Length": "4096"}, 413),
+    ],
+)
+def test_rejects_bad_content_length(server, headers, status):
+    _, port = server
+    assert post(port, headers=headers)[0] == status
+
+
+def test_schema_download_failure_is_not_cached(server, monkeypatch):
+    svc, port = server
+
+    def unavailable():
+        raise validator.SchemaUnavailableError("Failed to load schema: offline")
+
+    monkeypatch.setattr(validator, "load_schema_from_web", unavailable)
+    body = b"{}"
+    headers = {"Content-Length": str(len(body))}
+    for _ in range(2):
+        status, payload = post(port, body, headers)
+        assert status == 503
+        assert "offline" in payload["error"]
+    assert svc.stats["cache_hits"] == 0
+
+    monkeypatch.setattr(validator, "load_schema_from_web", lambda: {})
+    status, payload = post(port, body, headers)
+    assert status == 200
+    assert payload["valid"] is True
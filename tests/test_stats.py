@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from src import stats
+
+
+def _runs(rng, n_runs=3):
+    metadata_list, metric_dfs = [], []
+    for r in range(n_runs):
+        metadata_list.append({"label": f"run{r}"})
+        metric_dfs.append(
+            pd.DataFrame(
+                {
+                    "name": ["intensity", "rt", "count"],
+                    "value": [
+                        list(rng.normal(r, 1, size=rng.integers(1, 200))),
+                        list(rng.uniform(0, 60, size=rng.integers(1, 50))),
+                        42,
+                    ],
+                }
+            )
+        )
+    return metadata_list, metric_dfs
+
+
+def test_matches_numpy_quantiles_and_histograms():
+    rng = np.random.default_rng(0)
+    metadata_list, metric_dfs = _runs(rng)
+    summary = stats.summarize_list_metrics(metric_dfs, metadata_list, bins=7)
+
+    assert len(summary) == 6
+    for name, rows in summary.groupby("name"):
+        lists = [
+            np.asarray(df.loc[df["name"] == name, "value"].iloc[0]) for df in metric_dfs
+        ]
+        lo = min(a.min() for a in lists)
+        hi = max(a.max() for a in lists)
+        for (_, row), values in zip(rows.iterrows(), lists):
+            assert row["length"] == len(values)
+            assert row["min"] == values.min()
+            assert row["max"] == values.max()
+            np.testing.assert_allclose(row["mean"], values.mean())
+            np.testing.assert_allclose(
+                [row["q1"], row["median"], row["q3"]],
+                np.quantile(values, [0.25, 0.5, 0.75]),
+            )
+            counts, edges = np.histogram(values, bins=7, range=(lo, hi))
+            assert row["hist_counts"] == counts.tolist()
+            np.testing.assert_allclose(row["hist_start"], edges[0])
+            np.testing.assert_allclose(row["hist_width"], edges[1] - edges[0])
+
+
+def test_ignores_non_finite_values_but_reports_list_length():
+    metric_dfs = [pd.DataFrame({"name": ["l"], "value": [[float("nan"), 1.0, 3.0]]})]
+    summary = stats.summarize_list_metrics(metric_dfs, [{"label": "a"}])
+    row = summary.iloc[0]
+    assert row["length"] == 3
+    assert (row["min"], row["median"], row["max"]) == (1.0, 2.0, 3.0)
+
+
+def test_returns_none_without_list_metrics():
+    metric_dfs = [pd.DataFrame({"name": ["x"], "value": [1.0]})]
+    assert stats.summarize_list_metrics(metric_dfs, [{"label": "a"}]) is None
@@ -0,0 +1,40 @@
+import threading
+
+import pytest
+
+from src import validator
+
+
+@pytest.fixture
+def blocked(monkeypatch):
+    """Make validation jobs hang until the returned event is set."""
+    release = threading.Event()
+
+    def hanging(json_str):
+        release.wait(10)
+        return {"schema_checked": True}
+
+    monkeypatch.setattr(validator, "validate_full", hanging)
+    monkeypatch.setattr(validator, "_jobs", validator.OrderedDict())
+    monkeypatch.setattr(validator, "_pending", set())
+    yield release
+    release.set()
+
+
+def test_timed_out_job_is_not_resubmitted(blocked):
+    key = validator.submit_validation('{"a": 1}')
+    assert validator.poll_validation(key, timeout=0) == ("timeout", None)
+    misses = validator.cache_stats["misses"]
+    assert validator.submit_validation('{"a": 1}') == key
+    assert validator.cache_stats["misses"] == misses
+
+    blocked.set()
+    validator._jobs[key][0].result(timeout=5)
+    assert validator.poll_validation(key)[0] == "done"
+
+
+def test_refuses_jobs_beyond_the_pending_limit(blocked):
+    for i in range(validator.VALIDATION_MAX_PENDING):
+        validator.submit_validation(f'{{"n": {i}}}')
+    with pytest.raises(validator.ValidationBusyError):
+        validator.submit_validation('{"n": -1}')
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+from src import validator, watcher
+
+
+def _touch(tmp_path, name):
+    path = tmp_path / name
+    path.write_text("{}")
+    return str(path)
+
+
+def test_changed_file_keeps_its_position(tmp_path):
+    index = watcher.RunIndex()
+    paths = [_touch(tmp_path, f"{name}.mzQC") for name in "abc"]
+    for path, label in zip(paths, "abc"):
+        index.update_file(path, label, [{"label": label}], [pd.DataFrame()], "ok")
+    index.update_file(paths[0], "a2", [{"label": "a2"}], [pd.DataFrame()], "ok")
+    assert [meta["label"] for meta in index.snapshot()[0]] == ["a2", "b", "c"]
+
+
+def test_deleted_file_is_not_added_back(tmp_path):
+    index = watcher.RunIndex()
+    path = _touch(tmp_path, "a.mzQC")
+    index.update_file(path, "a", [{"label": "a"}], [pd.DataFrame()], "ok")
+    (tmp_path / "a.mzQC").unlink()
+    index.remove_file(path)
+    # A worker that was still processing the file finishes afterwards.
+    index.update_file(path, "a", [{"label": "a"}], [pd.DataFrame()], "ok")
+    assert index.paths() == []
+
+
+def test_schema_failure_is_retried_on_next_scan(tmp_path, monkeypatch):
+    def unavailable():
+        raise validator.SchemaUnavailableError("offline")
+
+    monkeypatch.setattr(validator, "load_schema_from_web", unavailable)
+    _touch(tmp_path, "a.mzQC")
+    folder_watcher = watcher.FolderWatcher(str(tmp_path))
+    assert folder_watcher.scan() == 1
+    folder_watcher.process(folder_watcher._queue.get())
+    assert folder_watcher.index.file_hash(str(tmp_path / "a.mzQC")) is None
+    assert folder_watcher.scan() == 1
+
+
+def test_refuses_folders_beyond_the_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(watcher, "_watchers", watcher.OrderedDict())
+    monkeypatch.setattr(watcher, "MAX_WATCHERS", 1)
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    try:
+        started = watcher.start_watcher(str(first))
+        with pytest.raises(watcher.WatcherLimitError):
+            watcher.start_watcher(str(second))
+        assert watcher.get_watcher(str(second)) is None
+        assert watcher.get_watcher(str(first)) is started
+    finally:
+        for folder_watcher in watcher._watchers.values():
+            folder_watcher.stop()